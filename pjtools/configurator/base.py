@@ -1,7 +1,14 @@
 import os
-from typing import Any, Dict, Type, Union
+import sys
+from typing import Any, Dict, Optional, Tuple, Type, Union
 
-from .dumper import DUMPER_REGISTRY
+from .dumper import DUMPER_REGISTRY, DUMPERS
+
+_MISSING = object()
+
+# Prefix marking a string value as an environment variable reference.
+_ENV_PREFIX = 'env:'
+_ENV_PREFIX_LEN = len(_ENV_PREFIX)
 
 
 class BaseConfigurator:
@@ -21,56 +28,62 @@ class BaseConfigurator:
     def __new__(cls,
                 *args,
                 singleton: bool = False,
+                lazy: bool = False,
                 **kwargs) -> 'BaseConfigurator':
         """
         Create a new instance or return the existing singleton instance.
 
+        An existing singleton is flagged so that the following ``__init__``
+        call merges the new configuration into it instead of reloading it.
+
         Args:
             singleton (bool): If True, a singleton instance will be
                 created/used.
+            lazy (bool): If True, the instance is created from the lazy
+                variant of the class.
 
         Returns:
             BaseConfigurator: A new or existing singleton instance of the
                 class.
         """
         if singleton:
-            if not cls._singleton_instance:
-                cls._singleton_instance = super(BaseConfigurator,
-                                                cls).__new__(cls)
-            return cls._singleton_instance
-        else:
-            return super(BaseConfigurator, cls).__new__(cls)
+            # The singleton is kept on the eager class, so lazy and eager
+            # requests share it and reset_singleton_instance() clears it.
+            # Look only at the class itself so that a subclass does not pick
+            # up the singleton of its parent.
+            cls = getattr(cls, '_eager_class', cls)
+            instance = cls.__dict__.get('_singleton_instance')
+            if instance is not None:
+                instance.__dict__['_skip_init'] = True
+                return instance
+
+        instance_cls = _lazy_class(cls) if lazy else cls
+        instance = super(BaseConfigurator, instance_cls).__new__(instance_cls)
+        if singleton:
+            cls._singleton_instance = instance
+        return instance
 
     def __init__(self,
                  config_dict: Union[Dict[str, Any], None] = None,
-                 singleton: bool = False) -> None:
+                 singleton: bool = False,
+                 lazy: bool = False) -> None:
         """Initialize a new configuration object.
 
         Args:
             config_dict (Union[Dict[str, Any], None]): Optional dictionary
                 containing initial configuration keys and values.
             singleton (bool): If True, singleton instance behavior is enabled.
+            lazy (bool): If True, nested dictionaries are only wrapped into
+                configuration objects when they are first accessed. This
+                saves work when only part of a large configuration is read.
         """
-        if singleton \
-            and BaseConfigurator._singleton_instance \
-                and BaseConfigurator._singleton_instance._is_initialized:
+        if self.__dict__.pop('_skip_init', False):
             self._merge_from_dict(config_dict)
             return
 
         if config_dict:
             self._load_from_dict(config_dict)
 
-        self._is_initialized = True
-
-    def _is_initialized(self) -> bool:
-        """
-        Check if the object is initialized.
-
-        Returns:
-            bool: True if initialized, otherwise False.
-        """
-        return getattr(self, '_initialized', False)
-
     @classmethod
     def reset_singleton_instance(cls) -> None:
         """
@@ -78,42 +91,30 @@ class BaseConfigurator:
             singleton instance.
         """
         cls._singleton_instance = None
-        if cls._singleton_instance:
-            cls._singleton_instance._is_initialized = False
 
     def _merge_from_dict(self, config_dict: Dict[str, Any]) -> None:
         if not config_dict:
             return
 
+        # Bind the builtins/globals used in the loop below as locals.
+        _isinstance, node_cls = isinstance, BaseConfigurator
+        environ, prefix, offset = os.environ, _ENV_PREFIX, _ENV_PREFIX_LEN
+        node_dict = self.__dict__
+        # Walk the keys in order, so new keys keep their order. Environment
+        # placeholders are resolved as in _load_from_dict.
         for key, value in config_dict.items():
-            if isinstance(value, dict):
-                if key in self.__dict__ and isinstance(self.__dict__[key],
-                                                       BaseConfigurator):
-                    self.__dict__[key]._merge_from_dict(value)
+            if type(value) is str:
+                if value.startswith(prefix):
+                    value = environ.get(value[offset:])
+                node_dict[key] = value
+            elif _isinstance(value, dict):
+                existing = node_dict.get(key)
+                if _isinstance(existing, node_cls):
+                    existing._merge_from_dict(value)
                 else:
-                    self.__dict__[key] = BaseConfigurator(value)
+                    node_dict[key] = node_cls(value)
             else:
-                self.__dict__[key] = value
-
-    @staticmethod
-    def _resolve_env_vars(value):
-        """Resolves environment variables in the given value. If the value is a
-        string and starts with 'env:', it is treated as an environment variable
-        name. The method retrieves the corresponding value from the environment
-        variables and returns it. If the environment variable is not found,
-        None is returned.
-
-        Args:
-            value (str or any): The value to resolve.
-
-        Returns:
-            The resolved value if it is an environment variable, otherwise the
-            original value.
-        """
-        if isinstance(value, str) and value.startswith('env:'):
-            env_var = value.split(':', 1)[1]
-            return os.environ.get(env_var, None)
-        return value
+                node_dict[key] = value
 
     def _load_from_dict(self, config_dict: Dict[str, Any]) -> None:
         """Load attributes from a dictionary.
@@ -121,23 +122,38 @@ class BaseConfigurator:
         Args:
             config_dict: Dictionary containing configuration keys and values.
         """
+        # Environment placeholders ('env:NAME') are resolved inline to the
+        # value of the variable, or None if it is not set; the exact type
+        # check keeps the common non-string case to a single comparison.
+        _isinstance, node_cls = isinstance, BaseConfigurator
+        environ, prefix, offset = os.environ, _ENV_PREFIX, _ENV_PREFIX_LEN
+        node_dict = self.__dict__
         for key, value in config_dict.items():
-            resolved_value = self._resolve_env_vars(value)
-            if isinstance(resolved_value, dict):
-                self.__dict__[key] = BaseConfigurator(resolved_value)
+            if type(value) is str:
+                if value.startswith(prefix):
+                    value = environ.get(value[offset:])
+                node_dict[key] = value
+            elif _isinstance(value, dict):
+                node_dict[key] = node_cls(value)
             else:
-                self.__dict__[key] = resolved_value
+                node_dict[key] = value
 
     def __getitem__(self, key: str) -> Any:
         """Get an attribute using dict-style key access.
 
+        Attribute-style access (``config.key``) is served directly by the
+        instance ``__dict__``; this only adds the ``config['key']`` form.
+
         Args:
             key: Attribute name to retrieve.
 
         Returns:
-            The value of the attribute or None if attribute is not set.
+            The value of the attribute.
+
+        Raises:
+            KeyError: If the attribute is not set.
         """
-        return self.__dict__.get(key, None)
+        return self.__dict__[key]
 
     def __setitem__(self, key: str, value: Any) -> None:
         """Set an attribute using dict-style key-value pairs.
@@ -148,25 +164,83 @@ class BaseConfigurator:
         """
         self.__dict__[key] = value
 
-    def __getattr__(self, key: str) -> Any:
-        """Get an attribute using attribute-style access.
+    @classmethod
+    def specialize(cls, schema: Dict[str, Any]) -> type:
+        """Return a subclass dedicated to configurations with the given keys.
+
+        CPython shares one key table between the instance dictionaries of a
+        class as long as its instances store the same keys in the same
+        order. Configurations of different layouts that all use one class
+        defeat this, so a per-layout class lets repeatedly created
+        configurations of that layout store only their values.
 
         Args:
-            key: Attribute name to retrieve.
+            schema (Dict[str, Any]): A configuration dictionary whose keys,
+                in order, define the layout.
+
+        Returns:
+            type: A subclass of ``cls``, created once per layout and reused
+                afterwards.
+        """
+        if '_schema' in cls.__dict__:
+            cls = cls.__base__
+        key = (cls, tuple(schema))
+        specialized = _SPECIALIZED_CLASSES.get(key)
+        if specialized is None:
+            specialized = _SPECIALIZED_CLASSES[key] = type(
+                f'Specialized{cls.__name__}', (cls, ), {'_schema': key[1]})
+        return specialized
+
+    def _specialized(self) -> 'BaseConfigurator':
+        """Copy the configuration tree onto per-layout classes.
 
         Returns:
-            The value of the attribute or None if attribute is not set.
+            BaseConfigurator: A copy in which every node is an instance of
+                the class returned by :meth:`specialize` for its keys.
         """
-        return self.__dict__.get(key, None)
+        self._materialize()
+        _isinstance, node_cls = isinstance, BaseConfigurator
+        root = type(self).specialize(self.__dict__)()
+        stack = [(self, root)]
+        while stack:
+            node, clone = stack.pop()
+            # Assign key by key: a bulk update would not share the keys.
+            clone_dict = clone.__dict__
+            for key, value in node.__dict__.items():
+                if _isinstance(value, node_cls):
+                    child = clone_dict[key] = type(value).specialize(
+                        value.__dict__)()
+                    stack.append((value, child))
+                else:
+                    clone_dict[key] = value
+        return root
 
-    def __setattr__(self, key: str, value: Any) -> None:
-        """Set an attribute using attribute-style access.
+    def _materialize(self) -> None:
+        """Wrap all nested dictionaries that have not been wrapped yet.
 
-        Args:
-            key: Attribute name.
-            value: Attribute value.
+        Eagerly loaded configurations are always fully wrapped, so this is a
+        no-op for them.
         """
-        self.__dict__[key] = value
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the configuration through its public class.
+
+        The classes behind lazy and specialized configurations are created
+        at runtime and cannot be looked up by name, so they are recreated
+        from the public class when unpickling.
+
+        Returns:
+            Tuple[Any, ...]: The callable that recreates the instance, its
+                arguments and the instance state.
+        """
+        cls = type(self)
+        lazy = issubclass(cls, _LazyConfiguratorMixin)
+        if lazy:
+            cls = cls._eager_class
+        schema = cls.__dict__.get('_schema')
+        if schema is not None:
+            cls = cls.__base__
+        return _rebuild, (cls, lazy, schema), self.__dict__
 
     @classmethod
     def fromfile(cls: Type['BaseConfigurator'],
@@ -194,11 +268,13 @@ class BaseConfigurator:
             filename: Name of the output file.
             format: The format to save the file in.
         """
-        data = self.to_dict()
-        dumper = DUMPER_REGISTRY.get(format)
-
+        dumper = DUMPERS.get(format)
         if dumper is None:
-            raise ValueError(f'Unsupported format: {format}')
+            if format not in DUMPER_REGISTRY:
+                raise ValueError(f'Unsupported format: {format}')
+            dumper = DUMPER_REGISTRY.get(format)
+
+        data = self.to_dict()
 
         dumper(data, filename)
 
@@ -208,31 +284,44 @@ class BaseConfigurator:
         Args:
             other_config: Another configuration object.
         """
-        for key, value in other_config.__dict__.items():
-            if value is not None:
-                if key not in self.__dict__:
-                    self.__dict__[key] = value
+        other_config._materialize()
+        _isinstance, node_cls = isinstance, BaseConfigurator
+        # Nested nodes are merged from an explicit stack of (target, source)
+        # dictionaries instead of one recursive call per level.
+        stack = [(self.__dict__, other_config.__dict__)]
+        while stack:
+            self_dict, other_dict = stack.pop()
+            for key, value in other_dict.items():
+                if value is None:
+                    # None does not override a value, but the key is kept.
+                    self_dict.setdefault(key, None)
+                    continue
+                existing = self_dict.get(key, _MISSING)
+                if existing is _MISSING:
+                    # Nothing to merge into, so take the whole subtree as is.
+                    self_dict[key] = value
+                elif _isinstance(existing, node_cls) and _isinstance(
+                        value, node_cls):
+                    existing._materialize()
+                    stack.append((existing.__dict__, value.__dict__))
+                elif _isinstance(existing, dict) and _isinstance(value, dict):
+                    existing.update(value)
                 else:
-                    if isinstance(self.__dict__[key], dict) and isinstance(
-                            value, dict):
-                        self.__dict__[key].update(value)
-                    elif isinstance(self.__dict__[key],
-                                    BaseConfigurator) and isinstance(
-                                        value, BaseConfigurator):
-                        self.__dict__[key].merge(value)
-                    else:
-                        self.__dict__[key] = value
+                    self_dict[key] = value
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the configuration to a dictionary."""
+        _isinstance, node_cls = isinstance, BaseConfigurator
         result = {}
-        for key, value in self.__dict__.items():
-            if key == '_is_initialized':
-                continue
-            if isinstance(value, BaseConfigurator):
-                result[key] = value.to_dict()
-            else:
-                result[key] = value
+        stack = [(self, result)]
+        while stack:
+            node, out = stack.pop()
+            for key, value in node.__dict__.items():
+                if _isinstance(value, node_cls):
+                    child = out[key] = {}
+                    stack.append((value, child))
+                else:
+                    out[key] = value
         return result
 
     def print(self, indent: int = 0) -> None:
@@ -241,9 +330,233 @@ class BaseConfigurator:
         Args:
             indent: The number of spaces to use for indentation.
         """
-        for key, value in self.__dict__.items():
-            if isinstance(value, BaseConfigurator):
-                print(' ' * indent + f'{key}:')
-                value.print(indent + 4)
+        _isinstance, node_cls = isinstance, BaseConfigurator
+        lines = []
+        stack = [(iter(self.__dict__.items()), indent, ' ' * indent)]
+        while stack:
+            items, depth, pad = stack[-1]
+            for key, value in items:
+                if _isinstance(value, node_cls):
+                    lines.append(f'{pad}{key}:\n')
+                    stack.append((iter(value.__dict__.items()), depth + 4,
+                                  ' ' * (depth + 4)))
+                    break
+                lines.append(f'{pad}{key}: {value}\n')
             else:
-                print(' ' * indent + f'{key}: {value}')
+                stack.pop()
+        sys.stdout.write(''.join(lines))
+
+
+class _UnwrappedDict(dict):
+    """A nested configuration dictionary that has not been wrapped yet.
+
+    Lazy configurations store the nested dictionaries of their loaded
+    configuration as this type, which sets them apart from plain
+    dictionaries assigned by the user afterwards.
+    """
+
+
+class _LazyConfiguratorMixin:
+    """Keep nested dictionaries as is and wrap them on first access.
+
+    Once :meth:`_materialize` has wrapped the whole tree the instance is
+    switched back to its eager class, so bulk operations such as
+    :meth:`merge` run on the regular code path. :meth:`to_dict` reads the
+    unwrapped parts directly and leaves the instance lazy.
+    """
+
+    _eager_class = BaseConfigurator
+
+    def _load_from_dict(self, config_dict: Dict[str, Any]) -> None:
+        """Load attributes from a dictionary without wrapping nested ones.
+
+        Nested dictionaries are copied into :class:`_UnwrappedDict` and
+        environment placeholders are resolved at every level, so wrapping a
+        node later only has to build it.
+
+        Args:
+            config_dict: Dictionary containing configuration keys and values.
+        """
+        _isinstance, unwrapped_cls = isinstance, _UnwrappedDict
+        environ, prefix, offset = os.environ, _ENV_PREFIX, _ENV_PREFIX_LEN
+        stack = [(config_dict, self.__dict__)]
+        while stack:
+            source, node_dict = stack.pop()
+            for key, value in source.items():
+                if type(value) is str:
+                    if value.startswith(prefix):
+                        value = environ.get(value[offset:])
+                    node_dict[key] = value
+                elif _isinstance(value, dict):
+                    child = node_dict[key] = unwrapped_cls()
+                    stack.append((value, child))
+                else:
+                    node_dict[key] = value
+
+    def __getattribute__(self, key: str) -> Any:
+        """Get an attribute, wrapping a loaded nested dictionary once.
+
+        Args:
+            key: Attribute name to retrieve.
+
+        Returns:
+            The value of the attribute.
+        """
+        value = object.__getattribute__(self, key)
+        if type(value) is _UnwrappedDict:
+            value = object.__getattribute__(self, '__dict__')[key] = _wrap(
+                value, _LazyBaseConfigurator)
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        """Get an attribute using dict-style key access.
+
+        Args:
+            key: Attribute name to retrieve.
+
+        Returns:
+            The value of the attribute.
+
+        Raises:
+            KeyError: If the attribute is not set.
+        """
+        node_dict = self.__dict__
+        value = node_dict[key]
+        if type(value) is _UnwrappedDict:
+            value = node_dict[key] = _wrap(value, _LazyBaseConfigurator)
+        return value
+
+    def _materialize(self) -> None:
+        """Wrap all nested dictionaries that have not been wrapped yet.
+
+        The whole tree is switched back to its eager classes afterwards.
+        """
+        _isinstance, node_cls = isinstance, BaseConfigurator
+        unwrapped_cls, lazy_cls = _UnwrappedDict, _LazyConfiguratorMixin
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            node_dict = node.__dict__
+            for key, value in node_dict.items():
+                if type(value) is unwrapped_cls:
+                    child = node_dict[key] = _wrap(value, node_cls)
+                    stack.append(child)
+                elif _isinstance(value, lazy_cls):
+                    stack.append(value)
+            if _isinstance(node, lazy_cls):
+                node.__class__ = node._eager_class
+
+    def _merge_from_dict(self, config_dict: Dict[str, Any]) -> None:
+        """Merge a configuration dictionary into the materialized tree.
+
+        Args:
+            config_dict: Dictionary containing configuration keys and values.
+        """
+        self._materialize()
+        self._merge_from_dict(config_dict)
+
+    def merge(self, other_config: BaseConfigurator) -> None:
+        """Merge another configuration object into the materialized tree.
+
+        Args:
+            other_config: Another configuration object.
+        """
+        self._materialize()
+        self.merge(other_config)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the configuration to a dictionary without wrapping it.
+
+        Returns:
+            Dict[str, Any]: The configuration as nested dictionaries.
+        """
+        _isinstance, node_cls = isinstance, BaseConfigurator
+        unwrapped_cls = _UnwrappedDict
+        result = {}
+        stack = [(self.__dict__, result)]
+        while stack:
+            source, out = stack.pop()
+            for key, value in source.items():
+                if type(value) is unwrapped_cls:
+                    child = out[key] = {}
+                    stack.append((value, child))
+                elif _isinstance(value, node_cls):
+                    child = out[key] = {}
+                    stack.append((value.__dict__, child))
+                else:
+                    out[key] = value
+        return result
+
+    def print(self, indent: int = 0) -> None:
+        """Print the configuration.
+
+        Args:
+            indent: The number of spaces to use for indentation.
+        """
+        self._materialize()
+        self.print(indent)
+
+
+_LAZY_CLASSES: Dict[type, type] = {}
+_SPECIALIZED_CLASSES: Dict[Tuple[type, Tuple[str, ...]], type] = {}
+
+
+def _lazy_class(cls: type) -> type:
+    """Return the lazy variant of a configurator class.
+
+    Args:
+        cls (type): A subclass of :class:`BaseConfigurator`.
+
+    Returns:
+        type: A subclass of ``cls`` that wraps nested dictionaries on first
+            access. The class is created once and reused afterwards.
+    """
+    if issubclass(cls, _LazyConfiguratorMixin):
+        return cls
+    lazy_cls = _LAZY_CLASSES.get(cls)
+    if lazy_cls is None:
+        lazy_cls = _LAZY_CLASSES[cls] = type(f'Lazy{cls.__name__}',
+                                             (_LazyConfiguratorMixin, cls),
+                                             {'_eager_class': cls})
+    return lazy_cls
+
+
+def _wrap(node_dict: _UnwrappedDict, cls: type) -> BaseConfigurator:
+    """Turn an unwrapped dictionary into a configuration node.
+
+    The dictionary was already prepared by the lazy loader, so it is adopted
+    as is instead of being loaded again.
+
+    Args:
+        node_dict (_UnwrappedDict): The nested dictionary to wrap.
+        cls (type): The class of the new node.
+
+    Returns:
+        BaseConfigurator: A node holding the keys of ``node_dict``.
+    """
+    node = object.__new__(cls)
+    node.__dict__.update(node_dict)
+    return node
+
+
+def _rebuild(cls: type, lazy: bool,
+             schema: Optional[Tuple[str, ...]]) -> BaseConfigurator:
+    """Create an empty configuration to unpickle into.
+
+    Args:
+        cls (type): The public configurator class.
+        lazy (bool): Whether the instance uses the lazy variant of the class.
+        schema (Optional[Tuple[str, ...]]): The keys of the specialized
+            class the instance uses, if any.
+
+    Returns:
+        BaseConfigurator: An instance without any configuration.
+    """
+    if schema is not None:
+        cls = cls.specialize(dict.fromkeys(schema))
+    if lazy:
+        cls = _lazy_class(cls)
+    return object.__new__(cls)
+
+
+_LazyBaseConfigurator = _lazy_class(BaseConfigurator)
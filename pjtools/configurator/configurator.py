@@ -1,7 +1,11 @@
+import ast
+import datetime
 import importlib.util
 import json
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+import os
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import yaml
 
@@ -9,6 +13,263 @@ from pjtools.registries import CONFIGURATOR_REGISTRY
 
 from .base import BaseConfigurator
 
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+# Immutable types that parsed configuration data can contain.
+_ATOMIC_TYPES = frozenset({
+    type(None), bool, int, float, complex, str, bytes, frozenset,
+    datetime.date, datetime.datetime
+})
+
+
+def _copy_tree(value: Any) -> Any:
+    """Deep-copy parsed configuration data.
+
+    Only the types produced by the JSON, YAML and literal parsers occur in
+    the cached data, so the copy handles them directly instead of going
+    through :func:`copy.deepcopy`.
+
+    Args:
+        value (Any): The value to copy.
+
+    Returns:
+        Any: A copy that shares no mutable container with ``value``.
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES:
+        return value
+    if value_type is dict:
+        return {k: _copy_tree(v) for k, v in value.items()}
+    if value_type is list:
+        return [_copy_tree(v) for v in value]
+    if value_type is tuple:
+        return tuple([_copy_tree(v) for v in value])
+    if value_type is set:
+        # Set elements are hashable, hence not mutable containers.
+        return set(value)
+    return value
+
+
+def _load_cached(filename: str, parse: Callable[[str], Any]) -> Any:
+    """Parse a file, reusing the previous result while it is unmodified.
+
+    The cache is keyed by absolute path and checked against the file's size
+    and nanosecond modification time on every call, so a rewrite within the
+    filesystem's timestamp granularity is still noticed when the size
+    changes. A deep copy is returned so callers are free to mutate the
+    result.
+
+    Args:
+        filename (str): The name of the file to parse.
+        parse (Callable[[str], Any]): The function used to parse the file
+            on a cache miss.
+
+    Returns:
+        Any: A copy of the parsed file content.
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+    """
+    # A single stat both checks that the file exists and validates the
+    # cache; abspath only joins with the working directory.
+    key = os.path.abspath(filename)
+    try:
+        stat = os.stat(key)
+    except FileNotFoundError:
+        raise FileNotFoundError(f'File {filename} does not exist') from None
+    version = (stat.st_size, stat.st_mtime_ns)
+    cached = _FILE_CACHE.get(key)
+    if cached is None or cached[0] != version:
+        cached = _FILE_CACHE[key] = (version, parse(key))
+    return _copy_tree(cached[1])
+
+
+def _parse_json(filepath: str) -> Dict[str, Any]:
+    """Parse a JSON configuration file.
+
+    orjson is used when it is installed. Files it rejects, such as those
+    containing NaN or Infinity, are parsed with the json module instead.
+
+    Args:
+        filepath (str): The filename of the JSON configuration file.
+
+    Returns:
+        Dict[str, Any]: The parsed configuration data.
+    """
+    with open(filepath, 'rb') as f:
+        content = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # e.g. NaN or Infinity, which the json module still accepts.
+            pass
+    return json.loads(content)
+
+
+def _parse_yaml(filepath: str) -> Dict[str, Any]:
+    """Parse a YAML configuration file.
+
+    Args:
+        filepath (str): The filename of the YAML configuration file.
+
+    Returns:
+        Dict[str, Any]: The parsed configuration data.
+    """
+    # Read the whole file in one call, like the JSON loader.
+    with open(filepath, 'rb') as f:
+        return yaml.load(f.read(), Loader=_YAMLLoader)
+
+
+def _literal_value(node: ast.expr) -> Any:
+    """Evaluate a literal expression node.
+
+    On top of what :func:`ast.literal_eval` accepts, ``dict(key=value)``
+    calls with literal keyword arguments are allowed at any depth, as
+    they are the usual way of writing nested configs.
+
+    Args:
+        node (ast.expr): The expression node to evaluate.
+
+    Returns:
+        Any: The value of the expression.
+
+    Raises:
+        ValueError: If the node is not a literal.
+    """
+    if isinstance(node, ast.Call):
+        if not (isinstance(node.func, ast.Name) and node.func.id == 'dict'
+                and not node.args and all(kw.arg is not None
+                                          for kw in node.keywords)):
+            raise ValueError('not a literal dict() call')
+        return {kw.arg: _literal_value(kw.value) for kw in node.keywords}
+    if isinstance(node, ast.Dict):
+        if None in node.keys:
+            raise ValueError('dict unpacking is not a literal')
+        return {
+            _literal_value(k): _literal_value(v)
+            for k, v in zip(node.keys, node.values)
+        }
+    if isinstance(node, ast.List):
+        return [_literal_value(elt) for elt in node.elts]
+    if isinstance(node, ast.Tuple):
+        return tuple([_literal_value(elt) for elt in node.elts])
+    return ast.literal_eval(node)
+
+
+def _eval_python_literals(filepath: str) -> Optional[Dict[str, Any]]:
+    """Evaluate a Python config file that only assigns literals.
+
+    Such files (the common case) are read with :func:`_literal_value`
+    instead of being imported, which skips compiling and executing the
+    module.
+
+    Args:
+        filepath (str): The filename of the Python configuration file.
+
+    Returns:
+        Optional[Dict[str, Any]]: The assigned names and values, or None if
+            the file contains anything other than literal assignments to
+            plain names and docstrings.
+    """
+    with open(filepath, 'rb') as f:
+        source = f.read()
+    try:
+        tree = ast.parse(source, filename=filepath)
+    except SyntaxError:
+        return None
+
+    namespace = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and all(
+                isinstance(target, ast.Name) for target in node.targets):
+            try:
+                value = _literal_value(node.value)
+            except (ValueError, TypeError, SyntaxError):
+                return None
+            for target in node.targets:
+                namespace[target.id] = value
+        elif not (isinstance(node, ast.Expr)
+                  and isinstance(node.value, ast.Constant)):
+            return None
+    return namespace
+
+
+def _split_namespace(namespace: Dict[str, Any]) -> Tuple[Dict[str, Any], Any]:
+    """Separate a Python config namespace into config values and bases.
+
+    Args:
+        namespace (Dict[str, Any]): The names defined by the config file.
+
+    Returns:
+        Tuple[Dict[str, Any], Any]: The public, non-module names and their
+            values, and the value of ``_base_`` (None if it is not set).
+    """
+    base_files = namespace.get('_base_')
+
+    # Imported modules are not configuration data, so they are left out.
+    config_dict = {
+        k: v
+        for k, v in namespace.items()
+        if not k.startswith('_') and not isinstance(v, ModuleType)
+    }
+
+    return config_dict, base_files
+
+
+def _parse_python_literals(
+        filepath: str) -> Optional[Tuple[Dict[str, Any], Any]]:
+    """Read a Python config file that only assigns literals.
+
+    This is the fast path for Python configs: the file is evaluated with
+    :func:`_eval_python_literals` and never imported. Its result is pure
+    data, so it is safe to cache.
+
+    Args:
+        filepath (str): The filename of the Python configuration file.
+
+    Returns:
+        Optional[Tuple[Dict[str, Any], Any]]: The config values and
+            ``_base_``, or None if the file contains code (imports, calls,
+            comprehensions, f-strings, ...) and has to be executed with
+            :func:`_exec_python` instead.
+    """
+    namespace = _eval_python_literals(filepath)
+    if namespace is None:
+        return None
+    return _split_namespace(namespace)
+
+
+def _exec_python(filepath: str) -> Tuple[Dict[str, Any], Any]:
+    """Execute a Python config file and read its namespace.
+
+    The result is never cached: the file runs on every load, so values it
+    computes (e.g. from the environment or the clock) are always current.
+
+    Args:
+        filepath (str): The filename of the Python configuration file.
+
+    Returns:
+        Tuple[Dict[str, Any], Any]: The config values and ``_base_``.
+    """
+    module_name = os.path.splitext(os.path.basename(filepath))[0]
+    spec = importlib.util.spec_from_file_location(module_name, filepath)
+    config_module = importlib.util.module_from_spec(spec)
+
+    # SourceFileLoader already reads and refreshes the __pycache__ bytecode,
+    # so no explicit py_compile pass is needed here.
+    spec.loader.exec_module(config_module)
+    return _split_namespace(vars(config_module))
+
 
 @CONFIGURATOR_REGISTRY.register('json')
 class JSONConfigurator(BaseConfigurator):
@@ -22,20 +283,23 @@ class JSONConfigurator(BaseConfigurator):
     @classmethod
     def fromfile(cls,
                  filename: str,
-                 singleton: bool = False) -> 'JSONConfigurator':
+                 singleton: bool = False,
+                 lazy: bool = False) -> 'JSONConfigurator':
         """Create a JSONConfigurator instance from a JSON file.
 
         Args:
             filename (str): The name of the JSON file to read.
             singleton (bool, optional): Whether to create a singleton instance.
                 Defaults to False.
+            lazy (bool, optional): Whether to wrap nested dictionaries only
+                when they are first accessed. Defaults to False.
 
         Returns:
             JSONConfigurator: An instance of JSONConfigurator initialized with
                 data from the JSON file.
         """
         config_dict = cls._load_json_config(filename)
-        return cls(config_dict, singleton=singleton)
+        return cls(config_dict, singleton=singleton, lazy=lazy)
 
     @staticmethod
     def _load_json_config(filename: str) -> Dict[str, Any]:
@@ -47,18 +311,7 @@ class JSONConfigurator(BaseConfigurator):
         Returns:
             Dict[str, Any]: A dictionary containing the configuration data.
         """
-        filepath = Path(filename).resolve()
-        if not filepath.exists():
-            raise FileNotFoundError(f'File {filename} does not exist')
-
-        with open(filepath, 'r') as f:
-            config_dict = json.load(f)
-
-        config_dict = {
-            k: BaseConfigurator._resolve_env_vars(v)
-            for k, v in config_dict.items()
-        }
-        return config_dict
+        return _load_cached(filename, _parse_json)
 
 
 @CONFIGURATOR_REGISTRY.register('py')
@@ -80,7 +333,8 @@ class PyConfigurator(BaseConfigurator):
     def __init__(self,
                  config_dict: Optional[Dict[str, Any]] = None,
                  base_files: Optional[List[str]] = None,
-                 singleton: bool = False) -> None:
+                 singleton: bool = False,
+                 lazy: bool = False) -> None:
         """
         Initialize the PyConfigurator object.
 
@@ -91,26 +345,83 @@ class PyConfigurator(BaseConfigurator):
                 configuration files to merge from. Defaults to None.
             singleton (bool, optional): Whether to create a singleton instance.
                 Defaults to False.
+            lazy (bool, optional): Whether to wrap nested dictionaries only
+                when they are first accessed. Defaults to False.
         """
-        super().__init__(config_dict, singleton=singleton)
+        super().__init__(config_dict, singleton=singleton, lazy=lazy)
         if base_files:
             self._base_ = base_files
 
     @classmethod
     def fromfile(cls,
                  filename: str,
-                 singleton: bool = False) -> 'PyConfigurator':
+                 singleton: bool = False,
+                 specialize: bool = False,
+                 lazy: bool = False) -> 'PyConfigurator':
         """Load a configuration from a Python file.
 
         Args:
             filename (str): The filename of the Python configuration file.
             singleton (bool, optional): Whether to create a singleton instance.
                 Defaults to False.
+            specialize (bool, optional): Whether to return an instance of a
+                class specialized to the loaded keys (see
+                :meth:`BaseConfigurator.specialize`), which is cheaper to
+                keep around when the same configuration is loaded many
+                times. Cannot be combined with ``singleton``. Defaults to
+                False.
+            lazy (bool, optional): Whether to wrap nested dictionaries only
+                when they are first accessed. Merging ``_base_`` files needs
+                the whole tree, so this only has an effect on files without
+                bases. Cannot be combined with ``specialize``. Defaults to
+                False.
 
         Returns:
             PyConfigurator: A PyConfigurator object with the loaded
                 configuration.
         """
+        if singleton and specialize:
+            raise ValueError('specialize cannot be used with singleton')
+        if lazy and specialize:
+            raise ValueError('specialize cannot be used with lazy')
+
+        order = []
+        cls._collect_bases(filename, set(), order)
+
+        if len(order) == 1:
+            # No _base_ files: nothing to merge into.
+            base_config = cls(order[0], singleton=singleton, lazy=lazy)
+        else:
+            base_config = cls(singleton=singleton)
+            for config_dict in order:
+                base_config.merge(cls(config_dict))
+
+        if specialize:
+            base_config = base_config._specialized()
+
+        return base_config
+
+    @classmethod
+    def _collect_bases(cls, filename: str, seen: Set[str],
+                       order: List[Dict[str, Any]]) -> None:
+        """Load a Python configuration file and, first, all of its bases.
+
+        Every file in the ``_base_`` graph is loaded once, even if it is
+        shared by several bases, and appended to ``order`` after its own
+        bases so that merging ``order`` front to back applies overrides in
+        inheritance order.
+
+        Args:
+            filename (str): The filename of the Python configuration file.
+            seen (Set[str]): Absolute paths of the files already visited.
+            order (List[Dict[str, Any]]): The configurations collected so
+                far, in merge order.
+        """
+        key = os.path.abspath(filename)
+        if key in seen:
+            return
+        seen.add(key)
+
         config_dict, base_files = cls._load_python_config(filename)
 
         if base_files is None:
@@ -119,17 +430,12 @@ class PyConfigurator(BaseConfigurator):
         if not isinstance(base_files, list):
             base_files = [base_files]
 
-        base_config = cls(singleton=singleton)
         for base_file in base_files:
-            if base_file is not None:
-                base_config.merge(cls.fromfile(base_file, singleton=singleton))
-            else:
+            if base_file is None:
                 raise ValueError('Invalid base_file: None')
+            cls._collect_bases(base_file, seen, order)
 
-        current_config = cls(config_dict, singleton=singleton)
-        base_config.merge(current_config)
-
-        return base_config
+        order.append(config_dict)
 
     @staticmethod
     def _load_python_config(filename: str) -> Dict[str, Any]:
@@ -145,32 +451,16 @@ class PyConfigurator(BaseConfigurator):
         Raises:
             FileNotFoundError: If the specified file does not exist.
         """
-        filepath = Path(filename).resolve()
-        if not filepath.exists():
-            raise FileNotFoundError(f'File {filename} does not exist')
-
-        module_name = filepath.stem
-        spec = importlib.util.spec_from_file_location(module_name, filepath)
-        config_module = importlib.util.module_from_spec(spec)
-
-        spec.loader.exec_module(config_module)
-
-        base_files = getattr(config_module, '_base_', None)
-
-        config_dict = {}
-
-        for attribute_name in dir(config_module):
-            if not attribute_name.startswith('_'):
-                attribute = getattr(config_module, attribute_name)
-                config_dict[attribute_name] = attribute
-
-        config_dict = {
-            k: PyConfigurator._resolve_env_vars(v)
-            for k, v in config_dict.items()
-        }
-        return config_dict, base_files
+        # Only files made of literals are cached. Files with code are run on
+        # every load, so values they compute (e.g. from the environment) are
+        # always current.
+        parsed = _load_cached(filename, _parse_python_literals)
+        if parsed is None:
+            parsed = _exec_python(filename)
+        return parsed
 
 
+@CONFIGURATOR_REGISTRY.register('yml')
 @CONFIGURATOR_REGISTRY.register('yaml')
 class YAMLConfigurator(BaseConfigurator):
     """Configuration class for reading YAML-based configuration files.
@@ -183,20 +473,23 @@ class YAMLConfigurator(BaseConfigurator):
     @classmethod
     def fromfile(cls,
                  filename: str,
-                 singleton: bool = False) -> 'YAMLConfigurator':
+                 singleton: bool = False,
+                 lazy: bool = False) -> 'YAMLConfigurator':
         """Create a YAMLConfigurator instance from a YAML file.
 
         Args:
             filename (str): The name of the YAML file to read.
             singleton (bool, optional): Whether to create a singleton instance.
                 Defaults to False.
+            lazy (bool, optional): Whether to wrap nested dictionaries only
+                when they are first accessed. Defaults to False.
 
         Returns:
             YAMLConfigurator: An instance of YAMLConfigurator initialized with
                 data from the YAML file.
         """
         config_dict = cls._load_yaml_config(filename)
-        return cls(config_dict, singleton=singleton)
+        return cls(config_dict, singleton=singleton, lazy=lazy)
 
     @staticmethod
     def _load_yaml_config(filename: str) -> Dict[str, Any]:
@@ -208,33 +501,17 @@ class YAMLConfigurator(BaseConfigurator):
         Returns:
             Dict[str, Any]: A dictionary containing the configuration data.
         """
-        filepath = Path(filename).resolve()
-        if not filepath.exists():
-            raise FileNotFoundError(f'File {filename} does not exist')
-
-        with open(filepath, 'r') as f:
-            config_dict = yaml.safe_load(f)
-
-        config_dict = {
-            k: BaseConfigurator._resolve_env_vars(v)
-            for k, v in config_dict.items()
-        }
-        return config_dict
+        return _load_cached(filename, _parse_yaml)
 
 
 class AutoConfigurator(BaseConfigurator):
     """Automatically select the appropriate configurator."""
 
-    CONFIGURATOR_REGISTRY = {
-        'json': JSONConfigurator,
-        'py': PyConfigurator,
-        'yaml': YAMLConfigurator
-    }
-
     @classmethod
     def fromfile(cls,
                  filename: str,
-                 singleton: bool = False) -> 'BaseConfigurator':
+                 singleton: bool = False,
+                 lazy: bool = False) -> 'BaseConfigurator':
         """Determine which configurator to use based on the file extension and
         load the file.
 
@@ -242,19 +519,30 @@ class AutoConfigurator(BaseConfigurator):
             filename (str): The name of the file to read.
             singleton (bool, optional): Whether to create a singleton instance.
                 Defaults to False.
+            lazy (bool, optional): Whether to wrap nested dictionaries only
+                when they are first accessed. Defaults to False.
 
         Returns:
             BaseConfigurator: An instance of the appropriate configurator class
                 initialized with data from the file.
         """
-        # Determine the file extension
-        file_extension = Path(filename).suffix[1:]
+        # Determine the file extension, lowercased and interned to match the
+        # registry keys
+        file_extension = sys.intern(os.path.splitext(filename)[1][1:].lower())
 
         # Look up the correct configurator class in the registry
-        configurator_class = cls.CONFIGURATOR_REGISTRY.get(file_extension)
-
-        if configurator_class is None:
-            raise ValueError(f"Unsupported file extension '{file_extension}'")
+        try:
+            configurator_class = CONFIGURATOR_REGISTRY.get(file_extension)
+        except KeyError:
+            raise ValueError(
+                f"Unsupported file extension '{file_extension}'") from None
 
         # Load the configuration using the selected configurator class
-        return configurator_class.fromfile(filename, singleton=singleton)
+        return configurator_class.fromfile(filename,
+                                           singleton=singleton,
+                                           lazy=lazy)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all parsed configuration files cached by the configurators."""
+        _FILE_CACHE.clear()
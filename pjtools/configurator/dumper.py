@@ -1,10 +1,43 @@
 import json
+import math
 from typing import Any, Dict
 
 import yaml
 
 from pjtools.registries import DUMPER_REGISTRY
 
+try:
+    from yaml import CSafeDumper as _YAMLDumper
+except ImportError:
+    from yaml import SafeDumper as _YAMLDumper
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Check whether data contains a NaN or infinite float.
+
+    Args:
+        data (Any): The data to check.
+
+    Returns:
+        bool: True if any float in ``data`` is not finite.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
 
 @DUMPER_REGISTRY.register('json')
 def json_dumper(data: Dict[str, Any], filename: str) -> None:
@@ -17,8 +50,21 @@ def json_dumper(data: Dict[str, Any], filename: str) -> None:
     Example:
         json_dumper({'key': 'value'}, 'config.json')
     """
-    with open(filename, 'w') as f:
-        json.dump(data, f, indent=4)
+    content = None
+    # orjson writes non-finite floats as null, so leave those to the json
+    # module, which writes NaN and Infinity.
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # e.g. non-string keys, which the json module still accepts.
+            pass
+    if content is None:
+        # Keep non-ASCII text as UTF-8, as orjson writes it.
+        content = json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+    with open(filename, 'wb') as f:
+        f.write(content)
 
 
 @DUMPER_REGISTRY.register('yaml')
@@ -32,8 +78,13 @@ def yaml_dumper(data: Dict[str, Any], filename: str) -> None:
     Example:
         yaml_dumper({'key': 'value'}, 'config.yaml')
     """
+    # Keys are written in config order, which also skips sorting them.
     with open(filename, 'w') as f:
-        yaml.dump(data, f)
+        yaml.dump(data,
+                  f,
+                  Dumper=_YAMLDumper,
+                  default_flow_style=False,
+                  sort_keys=False)
 
 
 @DUMPER_REGISTRY.register('py')
@@ -50,3 +101,6 @@ def py_dumper(data: Dict[str, Any], filename: str) -> None:
     with open(filename, 'w') as f:
         for key, value in data.items():
             f.write(f'{key} = {repr(value)}\n')
+
+
+DUMPERS = {'json': json_dumper, 'yaml': yaml_dumper, 'py': py_dumper}
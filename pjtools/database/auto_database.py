@@ -1,8 +1,11 @@
+import sys
 from typing import Dict
 
 from .base import BaseDatabase
 from .sqlite_wrapper import SQLiteDatabase
 
+_SQLITE = sys.intern('sqlite')
+
 
 class AutoDatabase:
     """
@@ -11,7 +14,7 @@ class AutoDatabase:
     """
 
     DATABASE_REGISTRY = {
-        'sqlite': SQLiteDatabase,
+        _SQLITE: SQLiteDatabase,
     }
 
     @classmethod
@@ -29,6 +32,10 @@ class AutoDatabase:
                 initialized with data from the configuration.
         """
         db_type = db_cfg.get('type')
+        if isinstance(db_type, str):
+            # Registry keys are interned, so an interned lookup key matches
+            # by identity without a string comparison.
+            db_type = sys.intern(db_type)
 
         database_class = cls.DATABASE_REGISTRY.get(db_type)
 
@@ -1,69 +1,355 @@
+import csv
+import functools
 import os
 import os.path as osp
+import queue
+import re
 import sqlite3
-from typing import Any, Dict, List, Tuple, Union
+import sys
+import time
+from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
 
 from .base import BaseDatabase
 
+# Python types to SQLite column types. bool is a subclass of int and is
+# stored as INTEGER; every bytes-like type is stored as BLOB.
+_TYPE_MAP = MappingProxyType({
+    bool: 'INTEGER',
+    int: 'INTEGER',
+    float: 'REAL',
+    str: 'TEXT',
+    bytes: 'BLOB',
+    bytearray: 'BLOB',
+    memoryview: 'BLOB',
+})
+
+
+class SQLiteBusyError(sqlite3.OperationalError):
+    """Raised when SQLite reports the database as busy or locked.
+
+    The operation failed only because another connection held a lock, so it
+    can usually be retried, see :func:`retry_on_busy`.
+    """
+
+
+def _is_busy(error: sqlite3.Error) -> bool:
+    """Check whether an error is SQLite's ``SQLITE_BUSY``/``SQLITE_LOCKED``."""
+    code = getattr(error, 'sqlite_errorcode', None)
+    if code is not None:
+        # The primary result code is in the low byte of extended codes.
+        return code & 0xff in (5, 6)
+    message = str(error)
+    return 'locked' in message or 'busy' in message
+
+
+@contextmanager
+def _raise_busy() -> Iterator[None]:
+    """Re-raise busy or locked errors as :class:`SQLiteBusyError`."""
+    try:
+        yield
+    except SQLiteBusyError:
+        raise
+    except sqlite3.OperationalError as e:
+        if _is_busy(e):
+            raise SQLiteBusyError(*e.args) from e
+        raise
+
+
+def retry_on_busy(max_tries: int = 5, base: float = 0.01) -> Callable:
+    """Retry a :class:`SQLiteDatabase` method while the database is busy.
+
+    The delay before each retry starts at ``base`` seconds and doubles after
+    every attempt. Calls made inside a transaction opened by the caller are
+    not retried, because the rest of that transaction would be lost.
+
+    Args:
+        max_tries (int): The maximum number of attempts.
+        base (float): The delay in seconds before the first retry.
+
+    Returns:
+        Callable: A decorator for the method to retry.
+
+    Examples:
+        >>> @retry_on_busy(max_tries=3)
+        ... def insert(self, table_name, data):
+        ...     ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            connection = self.connection
+            if connection is None:
+                raise sqlite3.ProgrammingError('database is closed')
+            if connection.in_transaction:
+                return func(self, *args, **kwargs)
+            for attempt in range(max_tries - 1):
+                try:
+                    return func(self, *args, **kwargs)
+                except SQLiteBusyError:
+                    time.sleep(base * 2**attempt)
+            return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
 
 class SQLiteDatabase(BaseDatabase):
     """A wrapper class for SQLite databases."""
 
-    PYTHON_SQLITE_TYPE_MAP = {
-        int: 'INTEGER',
-        float: 'REAL',
-        str: 'TEXT',
-        bytes: 'BLOB',
-    }
+    PYTHON_SQLITE_TYPE_MAP = _TYPE_MAP
 
     SQLITE_VALID_TYPES = {'INTEGER', 'REAL', 'TEXT', 'BLOB', 'NULL'}
 
+    IDENTIFIER_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+    # WAL lets readers run alongside a writer, and NORMAL sync is safe under
+    # WAL while avoiding an fsync per commit.
+    DEFAULT_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'temp_store': 'MEMORY',
+        'mmap_size': 1 << 30,
+        'cache_size': -65536,
+    }
+
     def __init__(self, db_cfg: Dict) -> None:
         """
         Initialize the database with the given file path and timeout.
 
         Args:
             db_cfg: A dictionary containing database configuration parameters.
+                Besides ``path``, ``timeout``, ``check_same_thread`` and
+                ``cached_statements``, it may hold a ``pragmas`` dictionary
+                that overrides or extends :attr:`DEFAULT_PRAGMAS`, and a
+                ``pool_size`` giving the number of extra read-only
+                connections used by the select and print methods.
         """
         self.db_path = db_cfg['path']
-        if self.db_path != ':memory:' and not osp.exists(
-                osp.dirname(self.db_path)):
-            os.makedirs(osp.dirname(self.db_path))
-        self.timeout = getattr(db_cfg, 'timeout', 5)
-        self.check_same_thread = getattr(db_cfg, 'check_same_thread', False)
+        if self.db_path != ':memory:':
+            os.makedirs(osp.dirname(self.db_path) or '.', exist_ok=True)
+        self.timeout = db_cfg.get('timeout', 5)
+        self.check_same_thread = db_cfg.get('check_same_thread', False)
+        self.cached_statements = db_cfg.get('cached_statements', 256)
+        self.pragmas = dict(self.DEFAULT_PRAGMAS,
+                            busy_timeout=int(self.timeout * 1000))
+        if self.db_path == ':memory:':
+            # An in-memory database has no journal file or mmap to tune.
+            del self.pragmas['journal_mode'], self.pragmas['mmap_size']
+        self.pragmas.update(db_cfg.get('pragmas') or {})
+        # Each connection to ':memory:' is a separate database, so reads can
+        # only be pooled for file databases.
+        self.pool_size = 0 if self.db_path == ':memory:' else db_cfg.get(
+            'pool_size', 0)
+        self._pool = None
+        # Generated SQL keyed by statement kind, table and column layout, so
+        # repeated calls reuse the same string and hit sqlite3's statement
+        # cache without rebuilding it.
+        self._sql_cache = {}
+        # Row-to-parameter binders keyed by column tuple, see _binder.
+        self._binders = {}
+        # Table and column names that already passed _check_ident.
+        self._valid_idents = set()
         self.connection = None
         self.connect()
 
     def connect(self) -> None:
-        """Establish a connection to the database."""
+        """Establish a connection to the database.
+
+        Does nothing if the database is already connected.
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened.
+        """
+        if self.connection is not None:
+            return
+        self.connection = self._open_connection(self.check_same_thread)
+        if self.pool_size:
+            self._pool = queue.SimpleQueue()
+            for _ in range(self.pool_size):
+                # Pooled connections are handed to whichever thread asks.
+                self._pool.put(self._open_connection(False))
+
+    def _open_connection(self, check_same_thread: bool) -> sqlite3.Connection:
+        """Open a new connection with the configured PRAGMAs applied."""
+        connection = sqlite3.connect(self.db_path,
+                                     timeout=self.timeout,
+                                     check_same_thread=check_same_thread,
+                                     cached_statements=self.cached_statements,
+                                     isolation_level=None)
         try:
-            self.connection = sqlite3.connect(
-                self.db_path,
-                timeout=self.timeout,
-                check_same_thread=self.check_same_thread)
-            self.connection.row_factory = sqlite3.Row
-        except sqlite3.Error as e:
-            print(f'An error occurred while connecting to the database: {e}')
+            connection.row_factory = sqlite3.Row
+            for name, value in self.pragmas.items():
+                connection.execute(f'PRAGMA {name}={value}')
+        except sqlite3.Error:
+            connection.close()
+            raise
+        return connection
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for a read-only query.
+
+        A pooled connection is used when a pool is configured, so that
+        concurrent readers do not queue on the main connection. Reads inside
+        an open transaction stay on the main connection to see its
+        uncommitted writes.
+        """
+        if self._pool is None or self.connection.in_transaction:
+            yield self.connection
+            return
+        connection = self._pool.get()
+        try:
+            yield connection
+        finally:
+            self._pool.put(connection)
 
     def close(self) -> None:
-        """Close the connection to the database."""
+        """Close the connection to the database.
+
+        ``PRAGMA optimize`` is run first so that SQLite refreshes the planner
+        statistics of tables whose contents have drifted since they were last
+        analyzed.
+        """
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            while not pool.empty():
+                pool.get_nowait().close()
         if self.connection:
+            connection, self.connection = self.connection, None
             try:
-                self.connection.close()
-            except sqlite3.Error as e:
-                print('An error occurred while closing the database '
-                      f'connection: {e}')
+                connection.execute('PRAGMA optimize')
             finally:
-                self.connection = None
+                connection.close()
+
+    def begin(self) -> None:
+        """Begin a transaction, taking the write lock up front.
+
+        The connection runs in autocommit mode, so statements outside of
+        :meth:`begin` and :meth:`commit` are committed on their own.
+        """
+        if self.connection:
+            with _raise_busy():
+                self.connection.execute('BEGIN IMMEDIATE')
 
     def commit(self) -> None:
         """Commit the current transaction."""
         if self.connection:
-            try:
+            with _raise_busy():
                 self.connection.commit()
-            except sqlite3.Error as e:
-                print(
-                    f'An error occurred while committing the transaction: {e}')
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run the enclosed statements in a single transaction.
+
+        The transaction is committed once at the end, or rolled back if an
+        exception escapes. If a transaction is already open, the statements
+        simply join it.
+        """
+        if self.connection.in_transaction:
+            yield
+            return
+
+        self.begin()
+        try:
+            yield
+            self.commit()
+        except BaseException:
+            self.rollback()
+            raise
+
+    def _check_ident(self, *names: str) -> None:
+        """Ensure that table and column names are plain SQL identifiers.
+
+        Names are interpolated into the generated SQL, so anything other than
+        letters, digits and underscores is rejected. Valid names are
+        remembered and not matched again.
+
+        Raises:
+            ValueError: If a name is not a valid identifier.
+        """
+        valid_idents = self._valid_idents
+        for name in names:
+            if name in valid_idents:
+                continue
+            if not isinstance(name, str) or \
+                    not self.IDENTIFIER_PATTERN.fullmatch(name):
+                raise ValueError(f'Invalid SQL identifier: {name!r}')
+            valid_idents.add(name)
+
+    def _binder(self, keys: Tuple[str, ...]) -> Callable[[Dict], Tuple]:
+        """Return a cached callable that reads ``keys`` from a row dict and
+        returns their values as a tuple, in the given order."""
+        binder = self._binders.get(keys)
+        if binder is None:
+            getter = itemgetter(*keys)
+            if len(keys) == 1:
+                # itemgetter with a single key returns the bare value.
+                def binder(row):
+                    return (getter(row), )
+            else:
+                binder = getter
+            self._binders[keys] = binder
+        return binder
+
+    def _insert_sql(self, table_name: str, columns: Tuple[str, ...]) -> str:
+        """Return the cached INSERT statement for a column layout."""
+        key = ('insert', table_name, columns)
+        query = self._sql_cache.get(key)
+        if query is None:
+            self._check_ident(table_name, *columns)
+            keys = ', '.join(columns)
+            values_placeholder = ', '.join('?' * len(columns))
+            query = f'INSERT INTO {table_name} ({keys}) ' \
+                    f'VALUES ({values_placeholder})'
+            self._sql_cache[key] = query
+        return query
+
+    def _select_sql(self, table_name: str, columns: Tuple[str, ...],
+                    fields: Tuple[str, ...]) -> str:
+        """Return the cached SELECT statement for a condition layout, reading
+        ``fields`` or every column when it is empty."""
+        key = ('select', table_name, columns, fields)
+        query = self._sql_cache.get(key)
+        if query is None:
+            self._check_ident(table_name, *columns, *fields)
+            fields_str = ', '.join(fields) or '*'
+            query = f'SELECT {fields_str} FROM {table_name}'
+            if columns:
+                where_str = ' AND '.join(f'{k} = ?' for k in columns)
+                query = f'{query} WHERE {where_str}'
+            self._sql_cache[key] = query
+        return query
+
+    def _delete_sql(self, table_name: str, columns: Tuple[str, ...]) -> str:
+        """Return the cached DELETE statement for a condition layout."""
+        key = ('delete', table_name, columns)
+        query = self._sql_cache.get(key)
+        if query is None:
+            self._check_ident(table_name, *columns)
+            where_str = ' AND '.join(f'{k} = ?' for k in columns)
+            query = f'DELETE FROM {table_name} WHERE {where_str}'
+            self._sql_cache[key] = query
+        return query
+
+    def _update_sql(self, table_name: str, record_keys: Tuple[str, ...],
+                    condition_keys: Tuple[str, ...]) -> str:
+        """Return the cached UPDATE statement for the given column layouts."""
+        key = ('update', table_name, record_keys, condition_keys)
+        query = self._sql_cache.get(key)
+        if query is None:
+            self._check_ident(table_name, *record_keys, *condition_keys)
+            set_str = ', '.join(f'{k} = ?' for k in record_keys)
+            where_str = ' AND '.join(f'{k} = ?' for k in condition_keys)
+            query = f'UPDATE {table_name} SET {set_str} WHERE {where_str}'
+            self._sql_cache[key] = query
+        return query
 
     def execute(self,
                 query: str,
@@ -79,26 +365,30 @@ class SQLiteDatabase(BaseDatabase):
             execute_many (bool): Whether to use the `executemany()` method
                 instead
 
+        Note:
+            The query is committed on its own unless it runs inside a
+            transaction opened by :meth:`begin`.
+
         Returns:
             sqlite3.Cursor: A cursor object.
 
+        Raises:
+            SQLiteBusyError: If the database is locked by another connection.
+            sqlite3.Error: If the query fails for any other reason.
+
         Examples:
             >>> db = SQLiteDatabase({'path': 'path/to/database.db',
                                      'timeout': 5})
             >>> db.execute("INSERT INTO users (name, age) VALUES (?, ?)",
                            ("Alice", 30))
         """
-        try:
-            cursor = self.connection.cursor()
+        cursor = self.connection.cursor()
+        with _raise_busy():
             if not execute_many:
                 cursor.execute(query, params)
             else:
                 cursor.executemany(query, params)
-            self.commit()
-            return cursor
-        except sqlite3.Error as e:
-            print(f'An error occurred while executing the query: {e}')
-            self.rollback()
+        return cursor
 
     def create_table(
         self, table_name: str,
@@ -119,16 +409,17 @@ class SQLiteDatabase(BaseDatabase):
             >>> db.create_table('users', {'id': (int, 'PRIMARY KEY'),
                                           'name': str, 'age': int})
         """
+        self._check_ident(table_name, *schema)
+        type_map = self.PYTHON_SQLITE_TYPE_MAP
         columns = []
 
         for name, dtype in schema.items():
             if isinstance(dtype, tuple):
                 python_dtype, extra_info = dtype
-                sqlite_dtype = self.PYTHON_SQLITE_TYPE_MAP.get(
-                    python_dtype, 'TEXT')
+                sqlite_dtype = type_map.get(python_dtype, 'TEXT')
                 column_definition = f'{name} {sqlite_dtype} {extra_info}'
             elif isinstance(dtype, type):
-                sqlite_dtype = self.PYTHON_SQLITE_TYPE_MAP.get(dtype, 'TEXT')
+                sqlite_dtype = type_map.get(dtype, 'TEXT')
                 column_definition = f'{name} {sqlite_dtype}'
             else:
                 sqlite_dtype = dtype.upper() if dtype.upper(
@@ -158,6 +449,7 @@ class SQLiteDatabase(BaseDatabase):
             >>> db.connect()
             >>> db.drop_table('users')
         """
+        self._check_ident(table_name)
         if if_exists:
             query = f'DROP TABLE IF EXISTS {table_name}'
         else:
@@ -166,6 +458,7 @@ class SQLiteDatabase(BaseDatabase):
 
         return cursor
 
+    @retry_on_busy()
     def insert(self, table_name: str, data: dict) -> sqlite3.Cursor:
         """
         Insert a single row of data into the specified table.
@@ -181,15 +474,12 @@ class SQLiteDatabase(BaseDatabase):
             >>> db.connect()
             >>> db.insert('users', {'name': 'Alice', 'age': 25})
         """
-        keys = ', '.join(data.keys())
-        values_placeholder = ', '.join('?' * len(data))
-        values = tuple(data.values())
-        query = f'INSERT INTO {table_name} ({keys}) ' \
-                f'VALUES ({values_placeholder})'
-        cursor = self.execute(query, values)
+        query = self._insert_sql(table_name, tuple(data))
+        cursor = self.execute(query, tuple(data.values()))
 
         return cursor
 
+    @retry_on_busy()
     def inserts(self, table_name: str,
                 data_list: List[Dict]) -> sqlite3.Cursor:
         """
@@ -208,17 +498,66 @@ class SQLiteDatabase(BaseDatabase):
                            [{'name': 'Alice', 'age': 25},
                             {'name': 'Bob', 'age': 30}])
         """
-        keys = ', '.join(data_list[0].keys())
-        values_placeholder = ', '.join('?' * len(data_list[0]))
-        query = f'INSERT INTO {table_name} ({keys}) ' \
-                f'VALUES ({values_placeholder})'
-        cursor = self.execute(
-            query,
-            params=[tuple(data.values()) for data in data_list],
-            execute_many=True)
+        # The first row fixes the column order; later rows are read by key so
+        # that a different key order cannot shift values between columns.
+        # Rows are bound lazily as executemany consumes them.
+        keys = tuple(data_list[0])
+        query = self._insert_sql(table_name, keys)
+        with self._transaction():
+            cursor = self.execute(query,
+                                  params=map(self._binder(keys), data_list),
+                                  execute_many=True)
+
+        return cursor
+
+    def bulk_load_csv(self,
+                      table_name: str,
+                      path: str,
+                      header: bool = True) -> sqlite3.Cursor:
+        """
+        Load the rows of a CSV file into the specified table.
+
+        The file is streamed through ``csv.reader`` into a single
+        ``executemany`` call inside one transaction, so it is never held in
+        memory as a whole. Values are passed as text and converted by the
+        column type affinity.
+
+        Args:
+            table_name (str): The name of the table where the data should be
+                inserted.
+            path (str): The path of the CSV file.
+            header (bool): Whether the first line holds the column names. If
+                False, every line must provide a value for each column of the
+                table, in table order.
+
+        Raises:
+            ValueError: If ``header`` is True and the file is empty.
+
+        Examples:
+            >>> db = SQLiteDatabase('path/to/database.db')
+            >>> db.connect()
+            >>> db.bulk_load_csv('users', 'path/to/users.csv')
+        """
+        with open(path, newline='') as f:
+            reader = csv.reader(f)
+            if header:
+                columns = next(reader, None)
+                if columns is None:
+                    raise ValueError(f'CSV file {path} has no header line')
+                query = self._insert_sql(table_name, tuple(columns))
+            else:
+                self._check_ident(table_name)
+                columns = self.connection.execute(
+                    f'SELECT * FROM {table_name} LIMIT 0').description
+                values_placeholder = ', '.join('?' * len(columns))
+                query = f'INSERT INTO {table_name} ' \
+                        f'VALUES ({values_placeholder})'
+            with self._transaction():
+                cursor = self.execute(query, params=reader, execute_many=True)
 
         return cursor
 
+    @retry_on_busy()
     def delete(self, table_name: str, condition: Dict[str,
                                                       Any]) -> sqlite3.Cursor:
         """
@@ -235,13 +574,12 @@ class SQLiteDatabase(BaseDatabase):
             >>> db.connect()
             >>> db.delete('users', {"name": "Alice"})
         """
-        condition_str = ' AND '.join(
-            [f"{k}='{v}'" for k, v in condition.items()])
-        query = f'DELETE FROM {table_name} WHERE {condition_str}'
-        cursor = self.execute(query)
+        query = self._delete_sql(table_name, tuple(condition))
+        cursor = self.execute(query, tuple(condition.values()))
 
         return cursor
 
+    @retry_on_busy()
     def deletes(self, table_name: str,
                 conditions: List[Dict[str, Any]]) -> sqlite3.Cursor:
         """
@@ -256,18 +594,20 @@ class SQLiteDatabase(BaseDatabase):
         Examples:
             >>> db = SQLiteDatabase('path/to/database.db')
             >>> db.connect()
-            >>> db.deletes('users', [{"name": "Alice"}, {"age": "<30"}])
-        """
-        condition_strs = [
-            ' AND '.join([f"{k}='{v}'" for k, v in cond.items()])
-            for cond in conditions
-        ]
-        condition_query = ' OR '.join([f'({cond})' for cond in condition_strs])
-        query = f'DELETE FROM {table_name} WHERE {condition_query}'
-        cursor = self.execute(query)
-
+            >>> db.deletes('users', [{"name": "Alice"}, {"age": 30}])
+        """
+        # Values are bound as parameters, and consecutive conditions on the
+        # same columns share one statement sent with a single executemany.
+        groups = groupby(conditions, key=tuple)
+        cursor = self.connection.cursor()
+        with self._transaction(), _raise_busy():
+            for columns, group in groups:
+                cursor.executemany(
+                    self._delete_sql(table_name, columns),
+                    [tuple(condition.values()) for condition in group])
         return cursor
 
+    @retry_on_busy()
     def update(self, table_name: str, record: Dict[str, Any],
                condition: Dict[str, Any]) -> sqlite3.Cursor:
         """
@@ -286,14 +626,13 @@ class SQLiteDatabase(BaseDatabase):
             >>> db.connect()
             >>> db.update('users', {'age': 26}, {'name': 'Alice'})
         """
-        set_str = ', '.join([f'{k} = ?' for k in record.keys()])
-        where_str = ' AND '.join([f'{k} = ?' for k in condition.keys()])
-        query = f'UPDATE {table_name} SET {set_str} WHERE {where_str}'
-        values = tuple(list(record.values()) + list(condition.values()))
+        query = self._update_sql(table_name, tuple(record), tuple(condition))
+        values = (*record.values(), *condition.values())
         cursor = self.execute(query, values)
 
         return cursor
 
+    @retry_on_busy()
     def updates(self, table_name: str, records: list,
                 conditions: list) -> sqlite3.Cursor:
         """
@@ -314,22 +653,27 @@ class SQLiteDatabase(BaseDatabase):
                          [{'name': 'Alice'}, {'name': 'Bob'}],
                          [{'age': 20}, {'age': 30}])
         """
-        query = f'UPDATE {table_name} SET '
-
-        try:
-            cursor = self.connection.cursor()
-            for record, condition in zip(records, conditions):
-                set_clause = ', '.join([f'{k} = ?' for k in record.keys()])
-                where_clause = ' AND '.join(
-                    [f'{k} = ?' for k in condition.keys()])
-                cursor.execute(
-                    query + set_clause + ' WHERE ' + where_clause,
-                    list(record.values()) + list(condition.values()))
-            self.commit()
-        except sqlite3.Error as e:
-            print(f'An error occurred while updating data: {e}')
+        # Consecutive pairs with the same columns share one statement and
+        # are sent with a single executemany; running the groups in order
+        # keeps the original update order, which a global bucketing by
+        # layout would not. Within a group every pair has the group's key
+        # order, so the values can be bound directly and are streamed to
+        # executemany.
+        pairs = groupby(zip(records, conditions),
+                        key=lambda pair: (tuple(pair[0]), tuple(pair[1])))
+        cursor = self.connection.cursor()
+        with self._transaction(), _raise_busy():
+            for (record_keys, condition_keys), group in pairs:
+                cursor.executemany(
+                    self._update_sql(table_name, record_keys, condition_keys),
+                    ((*record.values(), *condition.values())
+                     for record, condition in group))
+        return cursor
 
-    def select(self, table_name: str, conditions: dict = None) -> List[Dict]:
+    def select(self,
+               table_name: str,
+               conditions: dict = None,
+               raw: bool = False) -> List[Union[Dict, sqlite3.Row]]:
         """
         Select a single row from the specified table based on the given
         conditions.
@@ -338,10 +682,13 @@ class SQLiteDatabase(BaseDatabase):
             table_name (str): The name of the table to select data from.
             conditions (dict, optional): A dictionary where the keys are column
                 names and the values are the conditions the data must meet.
+            raw (bool): Whether to return the ``sqlite3.Row`` objects as they
+                are instead of converting them to dictionaries.
 
         Returns:
-            List[Dict]: A list of dictionaries where each dictionary represents
-                a row of selected data.
+            List[Union[Dict, sqlite3.Row]]: A list of dictionaries (or rows
+                when ``raw`` is True) where each one represents a row of
+                selected data.
 
         Examples:
             >>> db = SQLiteDatabase('path/to/database.db')
@@ -350,25 +697,62 @@ class SQLiteDatabase(BaseDatabase):
             >>> print(data)
             [{'name': 'Alice', 'age': 25}]
         """
-        if conditions is None:
-            query = f'SELECT * FROM {table_name}'
-        else:
-            conditions_str = ' AND '.join(
-                [f'{key} = ?' for key in conditions.keys()])
-            query = f'SELECT * FROM {table_name} WHERE {conditions_str}'
-            values = tuple(conditions.values())
+        conditions = conditions or {}
+        query = self._select_sql(table_name, tuple(conditions), ())
+
+        with self._reader() as connection:
+            cursor = connection.execute(query, tuple(conditions.values()))
+            rows = cursor.fetchall()
+        if raw:
+            return rows
+        columns = [d[0] for d in cursor.description]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def select_columnar(self,
+                        table_name: str,
+                        columns: List[str] = None,
+                        conditions: dict = None,
+                        batch_size: int = 10000) -> Dict[str, List]:
+        """
+        Select rows from the specified table and return them column by column.
 
-        try:
-            cursor = self.connection.cursor()
-            if conditions is None:
-                cursor.execute(query)
-            else:
-                cursor.execute(query, values)
-            rows = self.fetch_all(cursor)
-            return [dict(zip(row.keys(), row)) for row in rows]
-        except sqlite3.Error as e:
-            print(f'An error occurred while selecting data: {e}')
-            return []
+        Rows are streamed with ``fetchmany`` so that the full result set is
+        never held as a list of rows.
+
+        Args:
+            table_name (str): The name of the table to select data from.
+            columns (List[str], optional): The columns to select. If None, all
+                columns are selected.
+            conditions (dict, optional): A dictionary where the keys are column
+                names and the values are the conditions the data must meet.
+            batch_size (int): The number of rows fetched per batch.
+
+        Returns:
+            Dict[str, List]: A dictionary mapping each column name to the list
+                of its values.
+
+        Examples:
+            >>> db = SQLiteDatabase('path/to/database.db')
+            >>> db.connect()
+            >>> data = db.select_columnar('users', ['name', 'age'])
+            >>> print(data)
+            {'name': ['Alice', 'Bob'], 'age': [25, 30]}
+        """
+        conditions = conditions or {}
+        query = self._select_sql(table_name, tuple(conditions),
+                                 tuple(columns or ()))
+
+        with self._reader() as connection:
+            cursor = connection.execute(query, tuple(conditions.values()))
+            names = [d[0] for d in cursor.description]
+            values = [[] for _ in names]
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                for column, column_values in zip(values, zip(*batch)):
+                    column.extend(column_values)
+        return dict(zip(names, values))
 
     def selects(self, table_name: str,
                 conditions_list: List[Dict]) -> List[List[Dict]]:
@@ -394,37 +778,27 @@ class SQLiteDatabase(BaseDatabase):
             [[{'name': 'Alice', 'age': 25}], [{'name': 'Bob', 'age': 30}]]
         """
         result = []
+        # Every query reads the same table, so the column names are taken
+        # from the first result and reused for the rest.
+        columns = None
 
         for conditions in conditions_list:
-            if conditions is None:
-                query = f'SELECT * FROM {table_name}'
-            else:
-                conditions_str = ' AND '.join(
-                    [f'{key} = ?' for key in conditions.keys()])
-                query = f'SELECT * FROM {table_name} WHERE {conditions_str}'
-                values = tuple(conditions.values())
+            conditions = conditions or {}
+            query = self._select_sql(table_name, tuple(conditions), ())
 
-            try:
-                cursor = self.connection.cursor()
-                if conditions is None:
-                    cursor.execute(query)
-                else:
-                    cursor.execute(query, values)
-                rows = self.fetch_all(cursor)
-                result.append([dict(row) for row in rows])
-            except sqlite3.Error as e:
-                print(f'An error occurred while selecting data: {e}')
-                result.append([])
+            with self._reader() as connection:
+                cursor = connection.execute(query, tuple(conditions.values()))
+                rows = cursor.fetchall()
+            if columns is None:
+                columns = [d[0] for d in cursor.description]
+            result.append([dict(zip(columns, row)) for row in rows])
 
         return result
 
     def rollback(self) -> None:
         """Rollback the current transaction."""
         if self.connection:
-            try:
-                self.connection.rollback()
-            except sqlite3.Error as e:
-                print(f'An error occurred while rolling back: {e}')
+            self.connection.rollback()
 
     def fetch_one(self, cursor: sqlite3.Cursor) -> Union[sqlite3.Row, None]:
         """
@@ -447,10 +821,7 @@ class SQLiteDatabase(BaseDatabase):
             >>> print(row)
             <sqlite3.Row object at 0x7f8a8e13dab0>
         """
-        try:
-            return cursor.fetchone()
-        except sqlite3.Error as e:
-            print(f'An error occurred while fetching data: {e}')
+        return cursor.fetchone()
 
     def fetch_all(self, cursor: sqlite3.Cursor) -> List[sqlite3.Row]:
         """
@@ -474,22 +845,14 @@ class SQLiteDatabase(BaseDatabase):
             <sqlite3.Row object at 0x7f8a8e13dab0>
             <sqlite3.Row object at 0x7f8a8e13db90>
         """
-        try:
-            return cursor.fetchall()
-        except sqlite3.Error as e:
-            print(f'An error occurred while fetching data: {e}')
+        return cursor.fetchall()
 
     def print_tables(self) -> None:
         """Print a list of all tables in the database."""
         query = "SELECT name FROM sqlite_master WHERE type='table';"
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute(query)
-            tables = self.fetch_all(cursor)
-            for table in tables:
-                print(table[0])
-        except sqlite3.Error as e:
-            print(f'An error occurred while fetching table names: {e}')
+        with self._reader() as connection:
+            cursor = connection.execute(query)
+            sys.stdout.writelines(f'{table[0]}\n' for table in cursor)
 
     def print_schema(self, table: str) -> None:
         """Print the schema of the specified table.
@@ -497,15 +860,13 @@ class SQLiteDatabase(BaseDatabase):
         Args:
             table: The name of the table to print the schema of.
         """
+        self._check_ident(table)
         query = f'PRAGMA table_info({table});'
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute(query)
-            schema = self.fetch_all(cursor)
-            for column in schema:
-                print(f'{column[1]} ({column[2]})')
-        except sqlite3.Error as e:
-            print(f'An error occurred while fetching the schema: {e}')
+        with self._reader() as connection:
+            cursor = connection.execute(query)
+            schema = cursor.fetchall()
+        for column in schema:
+            print(f'{column[1]} ({column[2]})')
 
     def print_row(self, table: str, condition: str) -> None:
         """Print a single row from the specified table based on the condition.
@@ -514,17 +875,15 @@ class SQLiteDatabase(BaseDatabase):
             table: The name of the table to print a row from.
             condition: The condition to identify the row to print.
         """
+        self._check_ident(table)
         query = f'SELECT * FROM {table} WHERE {condition};'
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute(query)
-            row = self.fetch_one(cursor)
-            if row:
-                print(dict(row))
-            else:
-                print(f'No row found with condition: {condition}')
-        except sqlite3.Error as e:
-            print(f'An error occurred while fetching the row: {e}')
+        with self._reader() as connection:
+            cursor = connection.execute(query)
+            row = cursor.fetchone()
+        if row:
+            print(dict(row))
+        else:
+            print(f'No row found with condition: {condition}')
 
     def print_rows(self,
                    table: str,
@@ -539,17 +898,15 @@ class SQLiteDatabase(BaseDatabase):
             limit: The maximum number of rows to print. If None, all matching
                 rows are printed.
         """
+        self._check_ident(table)
         query = f'SELECT * FROM {table}'
         if condition:
             query += f' WHERE {condition}'
         if limit:
             query += f' LIMIT {limit}'
         query += ';'
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute(query)
-            rows = self.fetch_all(cursor)
-            for row in rows:
-                print(dict(row))
-        except sqlite3.Error as e:
-            print(f'An error occurred while fetching the rows: {e}')
+        with self._reader() as connection:
+            # Rows are written as the cursor yields them rather than
+            # being fetched into a list first.
+            cursor = connection.execute(query)
+            sys.stdout.writelines(f'{dict(row)}\n' for row in cursor)
@@ -1,7 +1,11 @@
-from typing import Any, Callable, Optional, Type, TypeVar, Union
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Type, TypeVar, Union
 
 T = TypeVar('T')
 
+_MISSING = object()
+
 
 class Registry:
     """A registry to map strings to classes.
@@ -15,24 +19,35 @@ class Registry:
             distinguish between different module types.
     """
 
+    __slots__ = ('_category', '_modules', '_view', '_repr_cache')
+
     def __init__(self, category: str) -> None:
         """Initialize the registry with a given category."""
         self._category = category
         self._modules = {}
-
-    def register(self,
-                 name: Optional[str] = None) -> Callable[[Type[T]], Type[T]]:
+        self._view = MappingProxyType(self._modules)
+        self._repr_cache = None
+
+    def register(
+        self,
+        name: Optional[str] = None,
+        module: Optional[Type[T]] = None
+    ) -> Union[Type[T], Callable[[Type[T]], Type[T]]]:
         """Register a module with a given name.
 
-        This method can be used as a decorator.
+        This method can be used as a decorator, or called with the module to
+        register it directly.
 
         Args:
             name (Optional[str]): The name to register the module under.
                 If None, use the name of the module to be registered.
+            module (Optional[Type[T]]): The module to register. If None, a
+                decorator is returned instead.
 
         Returns:
-            Callable[[Type[T]], Type[T]]: A decorator for registering the
-                module.
+            Union[Type[T], Callable[[Type[T]], Type[T]]]: The registered
+                module, or a decorator for registering the module if
+                ``module`` is None.
 
         Examples:
             >>> @registry.register('example')
@@ -46,12 +61,18 @@ class Registry:
             _name = name
             if _name is None:
                 _name = module.__name__
+            # Interned keys let lookups with literal (hence interned) names
+            # match on identity without comparing the strings.
+            _name = sys.intern(_name)
             if _name in self._modules:
-                raise ValueError(
-                    f'Module {_name} already registered in {self._category}.')
+                raise ValueError(f'Module {_name!r} already registered in '
+                                 f'{self._category!r}.')
             self._modules[_name] = module
+            self._repr_cache = None
             return module
 
+        if module is not None:
+            return _register(module)
         return _register
 
     def get(self, name: str) -> Union[Type[Any], None]:
@@ -67,9 +88,23 @@ class Registry:
         Raises:
             KeyError: If the module name is not registered.
         """
-        if name not in self._modules:
-            raise KeyError(f'Module {name} not found in {self._category}.')
-        return self._modules[name]
+        module = self._modules.get(name, _MISSING)
+        if module is _MISSING:
+            raise KeyError(f'Module {name!r} not found in {self._category!r}.')
+        return module
+
+    __getitem__ = get
+
+    def modules(self) -> Mapping[str, Type[Any]]:
+        """Return a read-only view of the registered modules.
+
+        The view is live: it reflects later registrations without being
+        rebuilt, and cannot be used to modify the registry.
+
+        Returns:
+            Mapping[str, Type[Any]]: Mapping from registered names to modules.
+        """
+        return self._view
 
     def __contains__(self, name: str) -> bool:
         """Check if a module name is registered.
@@ -83,5 +118,10 @@ class Registry:
         return name in self._modules
 
     def __repr__(self) -> str:
-        """Return a string representation of the registry."""
-        return f'{self._category}: ' + ', '.join(self._modules.keys())
+        """Return a string representation of the registry.
+
+        The string is cached until the next module is registered.
+        """
+        if self._repr_cache is None:
+            self._repr_cache = f'{self._category}: ' + ', '.join(self._modules)
+        return self._repr_cache
@@ -1,5 +1,10 @@
+import json
+import os
+import shutil
+import tempfile
 import unittest
 
+from pjtools.configurator.base import BaseConfigurator
 from pjtools.configurator.configurator import (AutoConfigurator,
                                                JSONConfigurator,
                                                PyConfigurator,
@@ -25,3 +30,82 @@ class TestAutoConfigurator(unittest.TestCase):
         auto_config = AutoConfigurator.fromfile(str(yaml_file))
         yaml_config = YAMLConfigurator.fromfile(str(yaml_file))
         self.assertEqual(auto_config.to_dict(), yaml_config.to_dict())
+
+    def test_yml_extension(self):
+        yaml_file = 'tests/data/dummy_config.yaml'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ('config.yml', 'config.YAML'):
+                path = os.path.join(tmp_dir, name)
+                shutil.copy(yaml_file, path)
+                self.assertEqual(
+                    AutoConfigurator.fromfile(path).to_dict(),
+                    YAMLConfigurator.fromfile(yaml_file).to_dict())
+
+    def test_lazy_load(self):
+        for path in ('tests/data/dummy_config.json',
+                     'tests/data/dummy_config.yaml', 'tests/data/default.py'):
+            config = AutoConfigurator.fromfile(path, lazy=True)
+            eager = AutoConfigurator.fromfile(path)
+            for key, value in eager.__dict__.items():
+                if isinstance(value, BaseConfigurator):
+                    self.assertNotIsInstance(config.__dict__[key],
+                                             BaseConfigurator)
+            self.assertEqual(config.to_dict(), eager.to_dict())
+
+    def test_lazy_singleton_load(self):
+        for path, cls in (('tests/data/dummy_config.json', JSONConfigurator),
+                          ('tests/data/dummy_config.yaml', YAMLConfigurator),
+                          ('tests/data/default.py', PyConfigurator)):
+            cls.reset_singleton_instance()
+            config = AutoConfigurator.fromfile(path, singleton=True, lazy=True)
+            self.assertIs(cls.fromfile(path, singleton=True), config)
+            cls.reset_singleton_instance()
+            self.assertIsNot(
+                AutoConfigurator.fromfile(path, singleton=True, lazy=True),
+                config)
+            cls.reset_singleton_instance()
+
+    def test_unsupported_extension(self):
+        with self.assertRaises(ValueError):
+            AutoConfigurator.fromfile('tests/data/dummy_config.txt')
+
+    def test_missing_file(self):
+        with self.assertRaises(FileNotFoundError):
+            AutoConfigurator.fromfile('tests/data/missing_config.json')
+
+    def test_cached_load_is_isolated(self):
+        yaml_file = 'tests/data/dummy_config.yaml'
+        config = AutoConfigurator.fromfile(yaml_file)
+        config.layers.append(512)
+        reloaded = AutoConfigurator.fromfile(yaml_file)
+        self.assertEqual(reloaded.layers, [64, 128, 256])
+
+    def test_cache_invalidated_on_change(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_file = os.path.join(tmp_dir, 'config.json')
+            with open(json_file, 'w') as f:
+                json.dump({'a': 1}, f)
+            self.assertEqual(AutoConfigurator.fromfile(json_file).a, 1)
+
+            with open(json_file, 'w') as f:
+                json.dump({'a': 2}, f)
+            stat = os.stat(json_file)
+            os.utime(json_file, (stat.st_atime, stat.st_mtime + 1))
+            self.assertEqual(AutoConfigurator.fromfile(json_file).a, 2)
+
+            AutoConfigurator.clear_cache()
+            self.assertEqual(AutoConfigurator.fromfile(json_file).a, 2)
+
+    def test_cache_invalidated_on_size_change(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_file = os.path.join(tmp_dir, 'config.json')
+            with open(json_file, 'w') as f:
+                json.dump({'a': 1}, f)
+            stat = os.stat(json_file)
+            self.assertEqual(AutoConfigurator.fromfile(json_file).a, 1)
+
+            # Same timestamp, different content length.
+            with open(json_file, 'w') as f:
+                json.dump({'a': 10}, f)
+            os.utime(json_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual(AutoConfigurator.fromfile(json_file).a, 10)
@@ -1,4 +1,6 @@
+import io
 import unittest
+from unittest.mock import patch
 
 from pjtools.configurator.base import BaseConfigurator
 
@@ -10,11 +12,52 @@ class TestBaseConfigurator(unittest.TestCase):
         self.assertEqual(config.attr1, 1)
         self.assertEqual(config['attr2'], 'string')
 
+    def test_missing_attribute(self):
+        config = BaseConfigurator({'attr1': 1})
+        with self.assertRaises(AttributeError):
+            config.attr2
+        with self.assertRaises(KeyError):
+            config['attr2']
+
     def test_nested_config(self):
         config = BaseConfigurator({'attr1': {'nested_attr': 2}})
         self.assertIsInstance(config.attr1, BaseConfigurator)
         self.assertEqual(config.attr1.nested_attr, 2)
 
+    def test_lazy_nested_config(self):
+        config_dict = {'attr1': {'nested_attr': {'value': 2}}, 'attr2': 3}
+        config = BaseConfigurator(config_dict, lazy=True)
+        self.assertIsInstance(config.__dict__['attr1'], dict)
+        self.assertIsInstance(config.attr1, BaseConfigurator)
+        self.assertEqual(config['attr1'].nested_attr.value, 2)
+        self.assertEqual(config.to_dict(),
+                         BaseConfigurator(config_dict).to_dict())
+
+    def test_lazy_to_dict_keeps_raw_storage(self):
+        config_dict = {'attr1': {'nested': {'path': 'env:PJTOOLS_TEST_DIR'}}}
+        with patch.dict('os.environ', {'PJTOOLS_TEST_DIR': '/tmp/data'}):
+            config = BaseConfigurator(config_dict, lazy=True)
+        result = config.to_dict()
+        self.assertEqual(result, {'attr1': {'nested': {'path': '/tmp/data'}}})
+        self.assertNotIsInstance(config.__dict__['attr1'], BaseConfigurator)
+        self.assertIsNot(result['attr1'], config_dict['attr1'])
+        self.assertEqual(config.attr1.nested.path, '/tmp/data')
+
+    def test_lazy_keeps_assigned_dicts(self):
+        config = BaseConfigurator({'attr1': {'value': 1}}, lazy=True)
+        config.attr2 = {'value': 2}
+        config['attr3'] = {'value': 3}
+        self.assertIsInstance(config.attr1, BaseConfigurator)
+        self.assertIs(type(config.attr2), dict)
+        self.assertIs(type(config['attr3']), dict)
+        self.assertEqual(config.to_dict()['attr2'], {'value': 2})
+
+    def test_merge_lazy_config(self):
+        config1 = BaseConfigurator({'a': {'b': 1}})
+        config2 = BaseConfigurator({'a': {'c': 2}}, lazy=True)
+        config1.merge(config2)
+        self.assertEqual(config1.to_dict(), {'a': {'b': 1, 'c': 2}})
+
     def test_merge_with_common_and_unique_keys(self):
         config1 = BaseConfigurator({'a': 1, 'b': 2, 'c': {'x': 10, 'y': 20}})
         config2 = BaseConfigurator({'b': 3, 'c': {'y': 21, 'z': 30}, 'd': 4})
@@ -49,6 +92,13 @@ class TestBaseConfigurator(unittest.TestCase):
         config1.merge(config2)
         self.assertEqual(config1.to_dict(), {'a': {'b': 1, 'c': 2}})
 
+    def test_merge_deeply_nested_config(self):
+        config1 = BaseConfigurator({'a': {'b': {'c': {'d': 1, 'e': 2}}}})
+        config2 = BaseConfigurator({'a': {'b': {'c': {'e': 3}, 'f': 4}}})
+        config1.merge(config2)
+        expected = {'a': {'b': {'c': {'d': 1, 'e': 3}, 'f': 4}}}
+        self.assertEqual(config1.to_dict(), expected)
+
     def test_merge_with_different_types(self):
         config1 = BaseConfigurator({'a': 1})
         config2 = BaseConfigurator({'a': 'string'})
@@ -65,6 +115,27 @@ class TestBaseConfigurator(unittest.TestCase):
         config.attr1 = 1
         self.assertEqual(config['attr1'], 1)
 
+    def test_print(self):
+        config = BaseConfigurator({
+            'a': 1,
+            'b': {
+                'c': 2,
+                'd': {
+                    'e': 3
+                }
+            },
+            'f': 4
+        })
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            config.print()
+        self.assertEqual(stdout.getvalue(),
+                         'a: 1\nb:\n    c: 2\n    d:\n        e: 3\nf: 4\n')
+
+    def test_dump_unsupported_format(self):
+        config = BaseConfigurator({'a': 1})
+        with self.assertRaises(ValueError):
+            config.dumpfile('config.txt', format='txt')
+
     def test_singleton_instance(self):
         config1 = BaseConfigurator({'a': 1}, singleton=True)
         config2 = BaseConfigurator({'b': 2}, singleton=True)
@@ -72,6 +143,61 @@ class TestBaseConfigurator(unittest.TestCase):
         self.assertIs(config1, config2)
         self.assertEqual(config1.b, 2)
 
+    def test_singleton_nested_merge(self):
+        BaseConfigurator.reset_singleton_instance()
+        config = BaseConfigurator({'a': {'x': 1}, 'b': 1}, singleton=True)
+        BaseConfigurator({'a': {'y': 2}, 'b': 2, 'c': 3}, singleton=True)
+        self.assertEqual(config.to_dict(), {
+            'a': {
+                'x': 1,
+                'y': 2
+            },
+            'b': 2,
+            'c': 3
+        })
+        BaseConfigurator.reset_singleton_instance()
+
+    def test_singleton_merge_keeps_key_order(self):
+        BaseConfigurator.reset_singleton_instance()
+        config = BaseConfigurator({}, singleton=True)
+        update = {'a': {'x': 1}, 'b': 2, 'c': {'y': 3}, 'd': 4}
+        BaseConfigurator(update, singleton=True)
+        self.assertEqual(list(config.to_dict()), ['a', 'b', 'c', 'd'])
+        BaseConfigurator.reset_singleton_instance()
+
+    def test_reset_singleton_instance(self):
+        config1 = BaseConfigurator({'a': 1}, singleton=True)
+        BaseConfigurator.reset_singleton_instance()
+        config2 = BaseConfigurator({'b': 2}, singleton=True)
+        self.assertIsNot(config1, config2)
+        self.assertEqual(config2.to_dict(), {'b': 2})
+        BaseConfigurator.reset_singleton_instance()
+
+    def test_lazy_singleton_instance(self):
+        BaseConfigurator.reset_singleton_instance()
+        config1 = BaseConfigurator({'a': {'x': 1}}, singleton=True, lazy=True)
+        config2 = BaseConfigurator({'b': 2}, singleton=True)
+        self.assertIs(config1, config2)
+        self.assertEqual(config1.to_dict(), {'a': {'x': 1}, 'b': 2})
+
+        BaseConfigurator.reset_singleton_instance()
+        config3 = BaseConfigurator({'c': 3}, singleton=True, lazy=True)
+        self.assertIsNot(config3, config1)
+        self.assertEqual(config3.to_dict(), {'c': 3})
+        BaseConfigurator.reset_singleton_instance()
+
+    def test_subclass_singleton_instance(self):
+
+        class SubConfigurator(BaseConfigurator):
+            pass
+
+        config1 = BaseConfigurator({'a': 1}, singleton=True)
+        config2 = SubConfigurator({'b': 2}, singleton=True)
+        self.assertIsNot(config1, config2)
+        self.assertIsInstance(config2, SubConfigurator)
+        self.assertIs(SubConfigurator({'c': 3}, singleton=True), config2)
+        self.assertEqual(config2.to_dict(), {'b': 2, 'c': 3})
+
     def test_non_singleton_instance(self):
         config1 = BaseConfigurator({'a': 1})
         config2 = BaseConfigurator({'b': 2})
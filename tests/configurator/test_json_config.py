@@ -1,14 +1,18 @@
+import math
 import os
 import tempfile
 import unittest
+from unittest.mock import patch
 
 from pjtools.configurator.configurator import JSONConfigurator
 
 
 class TestJSONConfigurator(unittest.TestCase):
 
-    def setUp(self):
-        self.default_config = JSONConfigurator.fromfile(
+    @classmethod
+    def setUpClass(cls):
+        # The tests only read the config, so it is loaded once per class.
+        cls.default_config = JSONConfigurator.fromfile(
             'tests/data/dummy_config.json')
 
     def test_load_from_file(self):
@@ -48,8 +52,54 @@ class TestJSONConfigurator(unittest.TestCase):
             self.assertEqual(loaded_config.to_dict(),
                              self.default_config.to_dict())
 
+    def test_dump_non_string_keys(self):
+        config = JSONConfigurator({'ids': {1: 'a', 2: 'b'}, 'name': 'café'})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, 'config.json')
+            config.dumpfile(tmp_path, format='json')
+            loaded_config = JSONConfigurator.fromfile(tmp_path)
+            self.assertEqual(loaded_config.ids.to_dict(), {'1': 'a', '2': 'b'})
+            self.assertEqual(loaded_config.name, 'café')
+            with open(tmp_path, 'rb') as f:
+                self.assertIn('café'.encode(), f.read())
+
+    def test_load_non_finite_floats(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, 'config.json')
+            with open(tmp_path, 'w') as f:
+                f.write('{"lr": NaN, "clip": Infinity}')
+            config = JSONConfigurator.fromfile(tmp_path)
+        self.assertTrue(math.isnan(config.lr))
+        self.assertEqual(config.clip, float('inf'))
+
+    def test_dump_non_finite_floats(self):
+        config = JSONConfigurator({'clip': float('inf'), 'lr': [float('nan')]})
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, 'config.json')
+            config.dumpfile(tmp_path, format='json')
+            loaded_config = JSONConfigurator.fromfile(tmp_path)
+        self.assertEqual(loaded_config.clip, float('inf'))
+        self.assertTrue(math.isnan(loaded_config.lr[0]))
+
     def test_env_var_loading(self):
         os.environ['PJTOOLS_DUMMY_TEST_DATABASE_URL'] = '127.0.0.1'
         config = JSONConfigurator.fromfile('tests/data/dummy_config.json')
         self.assertEqual(config.database.url, '127.0.0.1')
         del os.environ['PJTOOLS_DUMMY_TEST_DATABASE_URL']
+
+    def test_singleton_env_var_loading(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = os.path.join(tmp_dir, 'config.json')
+            with open(tmp_path, 'w') as f:
+                f.write('{"url": "env:PJTOOLS_DUMMY_TEST_URL", '
+                        '"database": {"url": "env:PJTOOLS_DUMMY_TEST_URL"}}')
+            JSONConfigurator.reset_singleton_instance()
+            with patch.dict('os.environ', {'PJTOOLS_DUMMY_TEST_URL': 'a'}):
+                config = JSONConfigurator.fromfile(tmp_path, singleton=True)
+            with patch.dict('os.environ', {'PJTOOLS_DUMMY_TEST_URL': 'b'}):
+                self.assertIs(
+                    JSONConfigurator.fromfile(tmp_path, singleton=True),
+                    config)
+            JSONConfigurator.reset_singleton_instance()
+        self.assertEqual(config.url, 'b')
+        self.assertEqual(config.database.url, 'b')
@@ -7,8 +7,10 @@ from pjtools.configurator.configurator import YAMLConfigurator
 
 class TestYAMLConfigurator(unittest.TestCase):
 
-    def setUp(self):
-        self.config = YAMLConfigurator.fromfile('tests/data/dummy_config.yaml')
+    @classmethod
+    def setUpClass(cls):
+        # The tests only read the config, so it is loaded once per class.
+        cls.config = YAMLConfigurator.fromfile('tests/data/dummy_config.yaml')
 
     def test_basic_types(self):
         self.assertEqual(self.config.learning_rate, 0.001)
@@ -46,6 +48,12 @@ class TestYAMLConfigurator(unittest.TestCase):
             loaded_config = YAMLConfigurator.fromfile(tmp_path)
             self.assertEqual(loaded_config.to_dict(), self.config.to_dict())
 
+    def test_dump_keeps_key_order(self):
+        config = YAMLConfigurator({'b': 1, 'a': {'d': 2, 'c': 3}})
+        with tempfile.NamedTemporaryFile(suffix='.yaml', mode='w+t') as tmp:
+            config.dumpfile(tmp.name, format='yaml')
+            self.assertEqual(tmp.read(), 'b: 1\na:\n  d: 2\n  c: 3\n')
+
     def test_env_var_loading(self):
         os.environ['PJTOOLS_DUMMY_TEST_DATABASE_URL'] = '127.0.0.1'
         config = YAMLConfigurator.fromfile('tests/data/dummy_config.json')
@@ -1,9 +1,14 @@
+import io
+import os.path as osp
 import sqlite3
+import tempfile
 import unittest
+from contextlib import redirect_stdout
 from unittest.mock import MagicMock
 
 from pjtools.configurator import AutoConfigurator
-from pjtools.database.sqlite_wrapper import SQLiteDatabase
+from pjtools.database.sqlite_wrapper import (SQLiteBusyError, SQLiteDatabase,
+                                             retry_on_busy)
 
 
 class TestSQLiteDatabase(unittest.TestCase):
@@ -22,10 +27,94 @@ class TestSQLiteDatabase(unittest.TestCase):
         db.connect()
         self.assertIsNotNone(db.connection)
 
+    def test_pragmas(self):
+        cfg = dict(self.db_cfg, timeout=2, pragmas={'cache_size': -1024})
+        db = SQLiteDatabase(cfg)
+        pragma = db.connection.execute
+        self.assertEqual(pragma('PRAGMA cache_size').fetchone()[0], -1024)
+        self.assertEqual(pragma('PRAGMA busy_timeout').fetchone()[0], 2000)
+        self.assertEqual(pragma('PRAGMA temp_store').fetchone()[0], 2)
+        db.close()
+
+    def test_connect_idempotent(self):
+        db = SQLiteDatabase(self.db_cfg)
+        connection = db.connection
+        db.connect()
+        self.assertIs(db.connection, connection)
+        db.close()
+
+    def test_connect_error(self):
+        cfg = dict(self.db_cfg, path='tests')
+        with self.assertRaises(sqlite3.Error):
+            SQLiteDatabase(cfg)
+
+    def test_read_pool(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cfg = dict(self.db_cfg,
+                       path=osp.join(tmpdir, 'pool.db'),
+                       pool_size=2)
+            db = SQLiteDatabase(cfg)
+            db.create_table('users', {'name': str})
+            db.insert('users', {'name': 'Alice'})
+            self.assertEqual(db.select('users'), [{'name': 'Alice'}])
+
+            db.begin()
+            db.insert('users', {'name': 'Bob'})
+            self.assertEqual(len(db.select('users')), 2)
+            db.commit()
+            bob = {'name': 'Bob'}
+            self.assertEqual(db.selects('users', [bob]), [[bob]])
+            db.close()
+            self.assertIsNone(db._pool)
+
+    def test_busy_error(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cfg = dict(self.db_cfg,
+                       path=osp.join(tmpdir, 'busy.db'),
+                       timeout=0)
+            writer = SQLiteDatabase(cfg)
+            writer.create_table('users', {'name': str})
+            db = SQLiteDatabase(cfg)
+
+            writer.begin()
+            with self.assertRaises(SQLiteBusyError):
+                db.insert('users', {'name': 'Alice'})
+            writer.commit()
+
+            db.insert('users', {'name': 'Alice'})
+            self.assertEqual(writer.select('users'), [{'name': 'Alice'}])
+            db.close()
+            writer.close()
+
+    def test_retry_on_busy(self):
+        attempts = []
+
+        @retry_on_busy(max_tries=3, base=0)
+        def write(db):
+            attempts.append(db)
+            if len(attempts) < 3:
+                raise SQLiteBusyError('database is locked')
+            return 'done'
+
+        db = MagicMock()
+        db.connection.in_transaction = False
+        self.assertEqual(write(db), 'done')
+        self.assertEqual(len(attempts), 3)
+
     def test_close(self):
         db = SQLiteDatabase(self.db_cfg)
         db.close()
         self.assertIsNone(db.connection)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            db.insert('users', {'name': 'Alice'})
+
+    def test_close_optimize(self):
+        db = SQLiteDatabase(self.db_cfg)
+        connection = db.connection = MagicMock(wraps=db.connection)
+        db.close()
+        connection.execute.assert_called_once_with('PRAGMA optimize')
+        connection.close.assert_called_once()
+        self.assertIsNone(db.connection)
 
     def test_create_table(self):
         db = SQLiteDatabase(self.db_cfg)
@@ -52,6 +141,39 @@ class TestSQLiteDatabase(unittest.TestCase):
         self.assertEqual(result_as_tuples, expected_schema)
         db.close()
 
+    def test_create_table_types(self):
+        db = SQLiteDatabase(self.db_cfg)
+        db.create_table('flags', {'enabled': bool, 'payload': bytearray})
+        schema = db.connection.execute('PRAGMA table_info(flags)').fetchall()
+        self.assertEqual([row[2] for row in schema], ['INTEGER', 'BLOB'])
+        db.close()
+
+    def test_create_table_type_map_override(self):
+
+        class TextBoolDatabase(SQLiteDatabase):
+            PYTHON_SQLITE_TYPE_MAP = {
+                **SQLiteDatabase.PYTHON_SQLITE_TYPE_MAP, bool: 'TEXT'
+            }
+
+        db = TextBoolDatabase(self.db_cfg)
+        db.create_table('flags', {'enabled': bool, 'count': int})
+        schema = db.connection.execute('PRAGMA table_info(flags)').fetchall()
+        self.assertEqual([row[2] for row in schema], ['TEXT', 'INTEGER'])
+        with self.assertRaises(TypeError):
+            SQLiteDatabase.PYTHON_SQLITE_TYPE_MAP[bool] = 'TEXT'
+        db.close()
+
+    def test_invalid_identifier(self):
+        db = SQLiteDatabase(self.db_cfg)
+        with self.assertRaises(ValueError):
+            db.create_table('users; DROP TABLE users', {'name': str})
+        with self.assertRaises(ValueError):
+            db.create_table('users', {'name TEXT, age': str})
+        db.create_table('users', {'name': str})
+        with self.assertRaises(ValueError):
+            db.select('users', {'name = name OR 1': 'x'})
+        db.close()
+
     def test_drop_table(self):
         db = SQLiteDatabase(self.db_cfg)
 
@@ -107,6 +229,50 @@ class TestSQLiteDatabase(unittest.TestCase):
         db.connection.execute('DROP TABLE test')
         db.close()
 
+    def test_inserts_key_order(self):
+        db = SQLiteDatabase(self.db_cfg)
+        db.create_table('users', {'name': 'TEXT', 'age': 'INTEGER'})
+
+        alice = {'name': 'Alice', 'age': 25}
+        db.inserts('users', [alice, {'age': 30, 'name': 'Bob'}])
+
+        bob = {'name': 'Bob', 'age': 30}
+        self.assertEqual(db.select('users'), [alice, bob])
+        db.inserts('users', [{'name': 'Carol'}])
+        carol = {'name': 'Carol', 'age': None}
+        self.assertEqual(db.select('users', {'name': 'Carol'}), [carol])
+        db.close()
+
+    def test_bulk_load_csv(self):
+        db = SQLiteDatabase(self.db_cfg)
+        db.create_table('users', {'name': 'TEXT', 'age': 'INTEGER'})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = osp.join(tmpdir, 'users.csv')
+            with open(path, 'w', newline='') as f:
+                f.write('age,name\n25,Alice\n30,"Bob, Jr."\n')
+            db.bulk_load_csv('users', path)
+            with open(path, 'w', newline='') as f:
+                f.write('Carol,35\n')
+            db.bulk_load_csv('users', path, header=False)
+
+        alice = {'name': 'Alice', 'age': 25}
+        bob = {'name': 'Bob, Jr.', 'age': 30}
+        carol = {'name': 'Carol', 'age': 35}
+        self.assertEqual(db.select('users'), [alice, bob, carol])
+        db.close()
+
+    def test_bulk_load_empty_csv(self):
+        db = SQLiteDatabase(self.db_cfg)
+        db.create_table('users', {'name': 'TEXT', 'age': 'INTEGER'})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = osp.join(tmpdir, 'users.csv')
+            open(path, 'w').close()
+            with self.assertRaisesRegex(ValueError, 'users.csv'):
+                db.bulk_load_csv('users', path)
+            db.bulk_load_csv('users', path, header=False)
+        self.assertEqual(db.select('users'), [])
+        db.close()
+
     def test_delete(self):
         db = SQLiteDatabase(self.db_cfg)
         db.connect()
@@ -149,6 +315,19 @@ class TestSQLiteDatabase(unittest.TestCase):
         db.connection.commit()
         db.close()
 
+    def test_deletes_parameterized(self):
+        db = SQLiteDatabase(self.db_cfg)
+        db.create_table('users', {'name': 'TEXT', 'age': 'INTEGER'})
+        obrien = {'name': "O'Brien", 'age': 25}
+        bob = {'name': 'Bob', 'age': 30}
+        carol = {'name': 'Carol', 'age': 35}
+        db.inserts('users', [obrien, bob, carol])
+
+        db.deletes('users', [{'name': "O'Brien"}, {'age': 30}])
+
+        self.assertEqual(db.select('users'), [carol])
+        db.close()
+
     def test_select(self):
         db = SQLiteDatabase(self.db_cfg)
         db.connect()
@@ -167,6 +346,31 @@ class TestSQLiteDatabase(unittest.TestCase):
         db.connection.execute('DROP TABLE test')
         db.close()
 
+    def test_select_raw(self):
+        db = SQLiteDatabase(self.db_cfg)
+        db.create_table('users', {'name': 'TEXT', 'age': 'INTEGER'})
+        db.insert('users', {'name': 'Alice', 'age': 25})
+
+        rows = db.select('users', {'name': 'Alice'}, raw=True)
+
+        self.assertIsInstance(rows[0], sqlite3.Row)
+        self.assertEqual(rows[0]['age'], 25)
+        db.close()
+
+    def test_select_columnar(self):
+        db = SQLiteDatabase(self.db_cfg)
+        db.create_table('users', {'name': 'TEXT', 'age': 'INTEGER'})
+        alice = {'name': 'Alice', 'age': 25}
+        bob = {'name': 'Bob', 'age': 30}
+        carol = {'name': 'Carol', 'age': 30}
+        db.inserts('users', [alice, bob, carol])
+
+        columns = {'name': ['Alice', 'Bob', 'Carol'], 'age': [25, 30, 30]}
+        self.assertEqual(db.select_columnar('users', batch_size=2), columns)
+        self.assertEqual(db.select_columnar('users', ['name'], {'age': 30}),
+                         {'name': ['Bob', 'Carol']})
+        db.close()
+
     def test_selects(self):
         db = SQLiteDatabase(self.db_cfg)
         db.connect()
@@ -244,6 +448,69 @@ class TestSQLiteDatabase(unittest.TestCase):
         db.connection.execute('DROP TABLE test')
         db.close()
 
+    def test_begin_commit(self):
+        db = SQLiteDatabase(self.db_cfg)
+        db.create_table('users', {'name': str})
+        self.assertFalse(db.connection.in_transaction)
+
+        db.begin()
+        db.insert('users', {'name': 'Alice'})
+        self.assertTrue(db.connection.in_transaction)
+        db.rollback()
+        self.assertEqual(db.select('users'), [])
+
+        db.insert('users', {'name': 'Bob'})
+        self.assertFalse(db.connection.in_transaction)
+        db.close()
+
+    def test_sql_cache(self):
+        db = SQLiteDatabase(self.db_cfg)
+        db.create_table('test_table', {'name': 'TEXT', 'age': 'INTEGER'})
+        alice = {'name': 'Alice', 'age': 25}
+        db.inserts('test_table', [alice])
+        self.assertEqual(db.select('test_table', {'name': 'Alice'}), [alice])
+        query = db._select_sql('test_table', ('name', ), ())
+        self.assertIs(db._select_sql('test_table', ('name', ), ()), query)
+        bob = {'name': 'Bob', 'age': 30}
+        db.insert('test_table', bob)
+        self.assertIs(db._insert_sql('test_table', ('name', 'age')),
+                      db._sql_cache[('insert', 'test_table', ('name', 'age'))])
+        self.assertEqual(db.select('test_table'), [alice, bob])
+        db.close()
+
+    def test_updates_mixed_columns(self):
+        db = SQLiteDatabase(self.db_cfg)
+        db.connection.execute(
+            'CREATE TABLE IF NOT EXISTS test '
+            '(id INTEGER PRIMARY KEY, name TEXT, age INTEGER)')
+        test_data = [{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}]
+        db.inserts('test', test_data)
+
+        update_data = [{'age': 26}, {'name': 'Bobby'}, {'age': 27}]
+        conditions = [{'name': 'Alice'}, {'name': 'Bob'}, {'name': 'Alice'}]
+        db.updates('test', update_data, conditions)
+
+        data = db.select('test')
+        self.assertEqual([(row['name'], row['age']) for row in data],
+                         [('Alice', 27), ('Bobby', 30)])
+        self.assertFalse(db.connection.in_transaction)
+
+        db.connection.execute('DROP TABLE test')
+        db.close()
+
+    def test_updates_keep_order(self):
+        db = SQLiteDatabase(self.db_cfg)
+        db.create_table('users', {'name': 'TEXT', 'age': 'INTEGER'})
+        db.insert('users', {'name': 'Alice', 'age': 25})
+
+        update_data = [{'name': 'Carol'}, {'age': 40}, {'name': 'Dave'}]
+        conditions = [{'name': 'Alice'}, {'name': 'Carol'}, {'age': 40}]
+        cursor = db.updates('users', update_data, conditions)
+
+        self.assertIsInstance(cursor, sqlite3.Cursor)
+        self.assertEqual(db.select('users'), [{'name': 'Dave', 'age': 40}])
+        db.close()
+
     def test_print_row(self):
         db = SQLiteDatabase(self.db_cfg)
         db.connect()
@@ -278,3 +545,18 @@ class TestSQLiteDatabase(unittest.TestCase):
         db.print_tables.assert_called_once()
 
         db.close()
+
+    def test_print_output(self):
+        db = SQLiteDatabase(self.db_cfg)
+        db.create_table('test_table', {'name': str, 'age': int})
+        test_data = [{'name': 'Alice', 'age': 25}, {'name': 'Bob', 'age': 30}]
+        db.inserts('test_table', test_data)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            db.print_tables()
+            db.print_rows('test_table', limit=1)
+        self.assertEqual(output.getvalue(),
+                         "test_table\n{'name': 'Alice', 'age': 25}\n")
+
+        db.close()
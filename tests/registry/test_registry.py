@@ -1,3 +1,4 @@
+import sys
 import unittest
 
 from pjtools.registry import Registry
@@ -14,9 +15,12 @@ class TestRegistry(unittest.TestCase):
 
         self.assertIn('example', reg)
         self.assertIs(reg.get('example'), ExampleModule)
+        self.assertIs(reg['example'], ExampleModule)
 
         with self.assertRaises(KeyError):
             reg.get('none_existent_module')
+        with self.assertRaises(KeyError):
+            reg['none_existent_module']
 
         with self.assertRaises(ValueError):
             reg.register('example')(ExampleModule)
@@ -24,3 +28,44 @@ class TestRegistry(unittest.TestCase):
     def test_registry_category(self):
         reg = Registry('Backbone')
         self.assertTrue(repr(reg).startswith('Backbone: '))
+
+    def test_registry_repr_updates(self):
+        reg = Registry('Backbone')
+        reg.register('a', int)
+        self.assertEqual(repr(reg), 'Backbone: a')
+        reg.register('b', float)
+        self.assertEqual(repr(reg), 'Backbone: a, b')
+
+    def test_registry_slots(self):
+        reg = Registry('Backbone')
+        with self.assertRaises(AttributeError):
+            reg.extra = 1
+
+    def test_registry_modules_view(self):
+        reg = Registry('Backbone')
+        modules = reg.modules()
+        reg.register('a', int)
+        self.assertEqual(dict(modules), {'a': int})
+        self.assertIs(reg.modules(), modules)
+        with self.assertRaises(TypeError):
+            modules['b'] = float
+
+    def test_registry_interned_names(self):
+        reg = Registry('Backbone')
+        name = ''.join(['Res', 'Net'])
+        reg.register(name)(object)
+        self.assertIs(next(iter(reg._modules)), sys.intern(name))
+        self.assertIs(reg.get('ResNet'), object)
+
+    def test_registry_register_module(self):
+        reg = Registry('Backbone')
+
+        class ExampleModule:
+            pass
+
+        self.assertIs(reg.register('example', ExampleModule), ExampleModule)
+        self.assertIs(reg.register(module=ExampleModule), ExampleModule)
+        self.assertIs(reg.get('ExampleModule'), ExampleModule)
+        message = "'example' already registered in 'Backbone'"
+        with self.assertRaisesRegex(ValueError, message):
+            reg.register('example', ExampleModule)